@@ -29,6 +29,7 @@ a = Analysis(
         'numpy',
         'keyboard',
         'pyautogui',
+        'orjson',
         'PyQt6',
         'PyQt6.QtCore',
         'PyQt6.QtGui',
@@ -13,7 +13,8 @@ from .hotkey_handler import HotkeyHandler
 from .text_output import TextOutput
 from .settings import (
     get_selected_model, set_selected_model,
-    record_transcription_time, get_estimated_transcription_time
+    record_transcription_time, get_estimated_transcription_time,
+    flush_settings
 )
 
 
@@ -407,3 +408,6 @@ class LocalWhisperApp(QObject):
         # Stop any ongoing recording
         if self.audio_recorder.is_recording():
             self.audio_recorder.stop_recording()
+        
+        # Write any buffered settings/stats changes to disk
+        flush_settings(fsync=True)
@@ -1,10 +1,17 @@
 """Global hotkey handler for Ctrl+Space detection."""
 
 import keyboard
+from functools import lru_cache
 from typing import Callable, Optional
 import threading
 
 
+@lru_cache(maxsize=32)
+def _format_hotkey(hotkey: str) -> str:
+    """Format a hotkey string for display (e.g. 'ctrl+space' -> 'Ctrl + Space')."""
+    return hotkey.replace("+", " + ").title()
+
+
 class HotkeyHandler:
     """Handles global hotkey registration and callbacks."""
     
@@ -59,5 +66,5 @@ class HotkeyHandler:
     
     def get_hotkey_display(self) -> str:
         """Get a human-readable display string for the hotkey."""
-        return self.hotkey.replace("+", " + ").title()
+        return _format_hotkey(self.hotkey)
 
@@ -1,34 +1,292 @@
 """Settings module for persisting user preferences."""
 
+import atexit
+import copy
 import json
+import mmap
 import os
+import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+# In-process cache of JSON files: path -> (stat key of the file on disk, parsed
+# data), where the key is None for a pending write. Writes update the cache
+# immediately and are flushed to disk after a short debounce delay (or on
+# explicit flush / interpreter exit).
+_SETTINGS_CACHE: dict[Path, tuple[Optional[tuple[int, int, int]], Any]] = {}
+_DIRTY: set[Path] = set()
+_FLUSH_DELAY = 0.5  # seconds
+_cache_lock = threading.RLock()
+
+# One background thread flushes pending writes once the debounce deadline
+# (a time.monotonic() value) has passed; None means nothing is scheduled.
+_FLUSH_THREAD_NAME = "settings-flush"
+_flush_deadline: Optional[float] = None
+_flush_wakeup = threading.Condition(_cache_lock)
+_flush_thread: Optional[threading.Thread] = None
+
+# Files larger than this are parsed from a memory map instead of a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json_file(path: Path, size: int) -> Any:
+    """
+    Parse a JSON file of the given size.
+    
+    Large files are memory-mapped and parsed in place by orjson, avoiding an
+    intermediate bytes copy. The stdlib json fallback can't parse a memory
+    map, so it always reads the file.
+    """
+    if orjson is None or size <= _MMAP_THRESHOLD:
+        return _json_loads(path.read_bytes())
+    
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The view must be released before the map is closed
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    """
+    Identify a file version by its mtime, size and inode.
+    
+    mtime alone misses rewrites within one timestamp tick on filesystems with
+    coarse times (NTFS advances in ~15.6 ms steps); the size and inode catch
+    most of those, including every append and every os.replace().
+    """
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _read_json_cached(path: Path, copy_result: bool = True) -> Any:
+    """
+    Read a JSON file, reusing the cached parse while the file is unchanged.
+    
+    Returns a deep copy so callers can mutate the result freely, unless
+    copy_result is False (the caller must then treat the result as read-only).
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist and has no pending write
+        json.JSONDecodeError: If the file contains invalid JSON (orjson's
+            JSONDecodeError is a subclass)
+    """
+    with _cache_lock:
+        entry = _SETTINGS_CACHE.get(path)
+        if path in _DIRTY:
+            # Pending write - the cache is newer than the file on disk
+            return copy.deepcopy(entry[1]) if copy_result else entry[1]
+        
+        st = path.stat()
+        key = _stat_key(st)
+        if entry is not None and entry[0] == key:
+            return copy.deepcopy(entry[1]) if copy_result else entry[1]
+        
+        data = _load_json_file(path, st.st_size)
+        _SETTINGS_CACHE[path] = (key, data)
+        return copy.deepcopy(data) if copy_result else data
+
+
+def _flush_worker() -> None:
+    """Flush pending writes each time the debounce deadline passes."""
+    with _flush_wakeup:
+        while True:
+            if _flush_deadline is None:
+                _flush_wakeup.wait()
+                continue
+            
+            remaining = _flush_deadline - time.monotonic()
+            if remaining > 0:
+                # Woken early when the deadline moves; re-check it either way
+                _flush_wakeup.wait(remaining)
+                continue
+            
+            try:
+                flush_settings()
+            except Exception as e:
+                # Keep the thread alive; see flush_settings() for what stays pending
+                print(f"Error flushing settings: {e}")
+
+
+def _cancel_scheduled_flush() -> None:
+    """Clear the debounce deadline so the flush thread goes idle."""
+    global _flush_deadline
+    
+    with _flush_wakeup:
+        _flush_deadline = None
+        _flush_wakeup.notify()
+
+
+def _write_json_buffered(path: Path, data: Any) -> None:
+    """Update the cached contents of a JSON file and schedule a flush to disk."""
+    global _flush_deadline, _flush_thread
+    
+    with _flush_wakeup:
+        _SETTINGS_CACHE[path] = (None, copy.deepcopy(data))
+        _DIRTY.add(path)
+        
+        # Debounce: push the deadline back so bursts of writes hit the disk once
+        _flush_deadline = time.monotonic() + _FLUSH_DELAY
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_worker, name=_FLUSH_THREAD_NAME, daemon=True)
+            _flush_thread.start()
+        else:
+            _flush_wakeup.notify()
+
+
+def _write_json_now(path: Path, data: Any, fsync: bool = False) -> None:
+    """
+    Write a JSON file immediately and record its new contents in the cache.
+    
+    The data is written to a temporary file that then replaces the target, so
+    a crash mid-write never leaves a truncated file behind.
+    
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        fsync: Force the data to disk before replacing the file
+    """
+    # Serialize first, so data that can't be encoded leaves no temporary file
+    payload = _json_dumps(data)
+    
+    with _cache_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _SETTINGS_CACHE[path] = (_stat_key(path.stat()), data)
+        _DIRTY.discard(path)
+
+
+def flush_settings(fsync: bool = False) -> None:
+    """
+    Write all pending settings and stats changes to disk.
+    
+    A pending write whose data can't be serialized is dropped before the
+    error is raised, so later flushes don't fail on it again. Writes that
+    fail with an OSError stay pending.
+    
+    Args:
+        fsync: Force the written files to disk; used for the flush on exit
+    """
+    with _cache_lock:
+        _cancel_scheduled_flush()
+        
+        for path in list(_DIRTY):
+            try:
+                _write_json_now(path, _SETTINGS_CACHE[path][1], fsync=fsync)
+            except (TypeError, ValueError):
+                # orjson's JSONEncodeError is a TypeError subclass
+                _DIRTY.discard(path)
+                _SETTINGS_CACHE.pop(path, None)
+                raise
+
+
+def reset_cache() -> None:
+    """
+    Drop all cached file contents, pending writes and resolved paths.
+    
+    Nothing is written to disk. Paths are re-resolved from APPDATA on next use.
+    """
+    with _cache_lock:
+        _cancel_scheduled_flush()
+        _SETTINGS_CACHE.clear()
+        _DIRTY.clear()
+    
+    get_settings_directory.cache_clear()
+    get_settings_path.cache_clear()
+    get_transcription_stats_path.cache_clear()
+    get_transcription_stats_log_path.cache_clear()
+
+
+atexit.register(flush_settings, fsync=True)
+
+
+@lru_cache(maxsize=1)
 def get_settings_directory() -> Path:
-    """Get the directory for storing application settings."""
+    """
+    Get the directory for storing application settings.
+    
+    The result is cached, so the directory is created at most once per process.
+    """
     appdata = os.environ.get('APPDATA', os.path.expanduser('~'))
     settings_dir = Path(appdata) / 'local-whisper'
     settings_dir.mkdir(parents=True, exist_ok=True)
     return settings_dir
 
 
+@lru_cache(maxsize=1)
 def get_settings_path() -> Path:
     """Get the path to the settings file."""
     return get_settings_directory() / 'settings.json'
 
 
+@lru_cache(maxsize=1)
 def get_transcription_stats_path() -> Path:
     """Get the path to the transcription stats file."""
     return get_settings_directory() / 'transcription_stats.json'
 
 
-def get_default_settings() -> dict[str, Any]:
-    """Get default settings."""
-    return {
-        "selected_model": "base"
-    }
+@lru_cache(maxsize=1)
+def get_transcription_stats_log_path() -> Path:
+    """Get the path to the append-only transcription sample log."""
+    return get_settings_directory() / 'transcription_stats.jsonl'
+
+
+# Model names used as settings values and stats keys. Literals are interned by
+# the compiler; names read from JSON are interned on load so lookups and
+# comparisons against these constants hit the identity fast path.
+MODEL_TINY = "tiny"
+MODEL_BASE = "base"
+MODEL_SMALL = "small"
+MODEL_MEDIUM = "medium"
+MODEL_LARGE_V3 = "large-v3"
+
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    "selected_model": MODEL_BASE
+})
+
+
+def get_default_settings() -> Mapping[str, Any]:
+    """
+    Get default settings.
+    
+    Returns a shared read-only mapping; copy it with dict() to modify it.
+    """
+    return _DEFAULT_SETTINGS
 
 
 def load_settings() -> dict[str, Any]:
@@ -40,37 +298,35 @@ def load_settings() -> dict[str, Any]:
     """
     settings_path = get_settings_path()
     
-    if not settings_path.exists():
-        return get_default_settings()
-    
     try:
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            settings = json.load(f)
-            # Merge with defaults to ensure all keys exist
-            defaults = get_default_settings()
-            defaults.update(settings)
-            return defaults
+        settings = _read_json_cached(settings_path)
     except (json.JSONDecodeError, IOError):
-        return get_default_settings()
+        return dict(_DEFAULT_SETTINGS)
+    
+    # Merge with defaults to ensure all keys exist
+    return {**_DEFAULT_SETTINGS, **settings}
 
 
 def save_settings(settings: dict[str, Any]) -> None:
     """
     Save settings to the settings file.
     
+    The write is buffered and reaches the disk after a short delay;
+    call flush_settings() to force it.
+    
     Args:
         settings: Dictionary of settings to save
     """
-    settings_path = get_settings_path()
-    
-    with open(settings_path, 'w', encoding='utf-8') as f:
-        json.dump(settings, f, indent=2)
+    _write_json_buffered(get_settings_path(), settings)
 
 
 def get_selected_model() -> str:
     """Get the currently selected model name."""
-    settings = load_settings()
-    return settings.get("selected_model", "base")
+    model_name = load_settings().get("selected_model")
+    if not isinstance(model_name, str):
+        # Missing or malformed value (e.g. null in a hand-edited file)
+        return MODEL_BASE
+    return sys.intern(model_name)
 
 
 def set_selected_model(model_name: str) -> None:
@@ -86,6 +342,118 @@ def set_selected_model(model_name: str) -> None:
 
 
 # Transcription stats functions for time estimation
+#
+# Stats are stored as a JSON snapshot plus an append-only JSONL log of samples
+# recorded since the snapshot was written. Recording a sample appends one line;
+# the log is folded into the snapshot once it grows past STATS_LOG_COMPACT_LINES.
+
+# Number of most recent samples kept per model
+MAX_STATS_SAMPLES = 20
+
+# Log length at which samples are folded into the snapshot
+STATS_LOG_COMPACT_LINES = 200
+
+_COMPACTION_THREAD_NAME = "transcription-stats-compaction"
+_compaction_thread: Optional[threading.Thread] = None
+
+
+def _add_sample(stats: dict[str, Any], model_name: str, audio_duration: float, transcription_time: float) -> None:
+    """
+    Add a sample to a stats dictionary in place.
+    
+    Keeps running sums of the retained samples so the average ratio is
+    updated in O(1) instead of re-summing the sample window.
+    """
+    if model_name not in stats:
+        stats[model_name] = {"samples": [], "avg_ratio": 1.0}
+    entry = stats[model_name]
+    
+    # Keep last MAX_STATS_SAMPLES samples per model
+    samples = deque(entry["samples"], maxlen=MAX_STATS_SAMPLES)
+    
+    if "sum_audio" in entry and "sum_transcription" in entry:
+        sum_audio = entry["sum_audio"]
+        sum_transcription = entry["sum_transcription"]
+    else:
+        # Stats written before running sums were tracked
+        sum_audio = sum(s["audio_duration"] for s in samples)
+        sum_transcription = sum(s["transcription_time"] for s in samples)
+    
+    # Subtract the sample that is about to be evicted
+    if len(samples) == MAX_STATS_SAMPLES:
+        evicted = samples[0]
+        sum_audio -= evicted["audio_duration"]
+        sum_transcription -= evicted["transcription_time"]
+    
+    samples.append({"audio_duration": audio_duration, "transcription_time": transcription_time})
+    sum_audio += audio_duration
+    sum_transcription += transcription_time
+    
+    entry["samples"] = list(samples)
+    entry["sum_audio"] = sum_audio
+    entry["sum_transcription"] = sum_transcription
+    
+    # Calculate average ratio (transcription_time / audio_duration)
+    if sum_audio > 0:
+        entry["avg_ratio"] = sum_transcription / sum_audio
+
+
+def _read_stats_log() -> list[tuple[str, float, float]]:
+    """
+    Read the logged samples as (model_name, audio_duration, transcription_time).
+    
+    The parsed log is cached until the file changes. Lines that can't be
+    parsed (e.g. a write cut short by a crash) are skipped.
+    """
+    log_path = get_transcription_stats_log_path()
+    
+    with _cache_lock:
+        try:
+            key = _stat_key(log_path.stat())
+        except FileNotFoundError:
+            return []
+        
+        entry = _SETTINGS_CACHE.get(log_path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        
+        samples = []
+        with open(log_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                    samples.append((sys.intern(record["model"]), record["a"], record["t"]))
+                except (ValueError, KeyError, TypeError):
+                    continue
+        
+        _SETTINGS_CACHE[log_path] = (key, samples)
+        return samples
+
+
+def _append_sample(model_name: str, audio_duration: float, transcription_time: float) -> int:
+    """
+    Append a sample to the stats log.
+    
+    Returns:
+        Number of samples in the log after appending
+    """
+    log_path = get_transcription_stats_log_path()
+    line = _json_dumps({"model": model_name, "a": audio_duration, "t": transcription_time}, indent=False)
+    
+    with _cache_lock:
+        samples = _read_stats_log()
+        with open(log_path, 'ab') as f:
+            f.write(line + b'\n')
+        samples = samples + [(sys.intern(model_name), audio_duration, transcription_time)]
+        _SETTINGS_CACHE[log_path] = (_stat_key(log_path.stat()), samples)
+        return len(samples)
+
+
+def _compact_transcription_stats() -> None:
+    """Fold the sample log into the stats snapshot and remove the log."""
+    with _cache_lock:
+        save_transcription_stats(load_transcription_stats())
+
 
 def load_transcription_stats() -> dict[str, Any]:
     """
@@ -93,62 +461,109 @@ def load_transcription_stats() -> dict[str, Any]:
     
     Returns:
         Dictionary with transcription stats per model.
-        Structure: {model_name: {"samples": [{"audio_duration": float, "transcription_time": float}], "avg_ratio": float}}
+        Structure: {model_name: {"samples": [{"audio_duration": float, "transcription_time": float}],
+                                 "avg_ratio": float, "sum_audio": float, "sum_transcription": float}}
     """
-    stats_path = get_transcription_stats_path()
-    
-    if not stats_path.exists():
-        return {}
-    
-    try:
-        with open(stats_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+    with _cache_lock:
+        try:
+            stats = _read_json_cached(get_transcription_stats_path())
+        except (json.JSONDecodeError, IOError):
+            stats = {}
+        
+        for model_name, audio_duration, transcription_time in _read_stats_log():
+            _add_sample(stats, model_name, audio_duration, transcription_time)
+        
+        return stats
 
 
 def save_transcription_stats(stats: dict[str, Any]) -> None:
     """
-    Save transcription statistics to file.
+    Save a full transcription statistics snapshot to file.
+    
+    The snapshot replaces everything recorded so far, so the sample log is
+    removed once the snapshot has been written.
     
     Args:
         stats: Dictionary of transcription stats
     """
     stats_path = get_transcription_stats_path()
+    log_path = get_transcription_stats_log_path()
     
-    with open(stats_path, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, indent=2)
+    with _cache_lock:
+        # Written immediately: the log may only be removed once the snapshot is on disk
+        _write_json_now(stats_path, copy.deepcopy(stats))
+        log_path.unlink(missing_ok=True)
+        _SETTINGS_CACHE.pop(log_path, None)
 
 
 def record_transcription_time(model_name: str, audio_duration: float, transcription_time: float) -> None:
     """
     Record a transcription time sample for future estimation.
     
+    Appends one line to the sample log; the log is compacted into the
+    snapshot in a background thread once it gets long.
+    
     Args:
         model_name: Name of the model used
         audio_duration: Duration of audio in seconds
         transcription_time: Time taken to transcribe in seconds
     """
-    stats = load_transcription_stats()
+    global _compaction_thread
     
-    if model_name not in stats:
-        stats[model_name] = {"samples": [], "avg_ratio": 1.0}
+    if _append_sample(model_name, audio_duration, transcription_time) <= STATS_LOG_COMPACT_LINES:
+        return
     
-    # Add new sample (keep last 20 samples per model)
-    sample = {"audio_duration": audio_duration, "transcription_time": transcription_time}
-    stats[model_name]["samples"].append(sample)
-    if len(stats[model_name]["samples"]) > 20:
-        stats[model_name]["samples"] = stats[model_name]["samples"][-20:]
+    with _cache_lock:
+        # One compaction at a time; samples it misses stay in the log for the next one
+        if _compaction_thread is not None and _compaction_thread.is_alive():
+            return
+        _compaction_thread = threading.Thread(
+            target=_compact_transcription_stats, name=_COMPACTION_THREAD_NAME, daemon=True
+        )
+        _compaction_thread.start()
+
+
+# Default ratios based on model complexity (rough estimates for CPU)
+# Ratio = transcription_time / audio_duration
+_DEFAULT_RATIOS = {
+    MODEL_TINY: 0.3,      # Very fast
+    MODEL_BASE: 0.5,      # Fast
+    MODEL_SMALL: 1.0,     # About real-time
+    MODEL_MEDIUM: 2.5,    # Slower
+    MODEL_LARGE_V3: 5.0,  # Slowest
+}
+
+
+def _historical_ratio(model_name: str) -> Optional[float]:
+    """
+    Get the average transcription ratio over a model's most recent samples.
     
-    # Calculate average ratio (transcription_time / audio_duration)
-    samples = stats[model_name]["samples"]
-    if samples:
-        total_audio = sum(s["audio_duration"] for s in samples)
-        total_transcription = sum(s["transcription_time"] for s in samples)
-        if total_audio > 0:
-            stats[model_name]["avg_ratio"] = total_transcription / total_audio
+    Only the requested model's samples are aggregated (snapshot samples
+    followed by logged ones, as load_transcription_stats() would replay them),
+    without copying or replaying the stats of other models.
+    
+    Returns:
+        The ratio, or None if the model has no recorded samples
+    """
+    with _cache_lock:
+        try:
+            entry = _read_json_cached(get_transcription_stats_path(), copy_result=False).get(model_name, {})
+        except (json.JSONDecodeError, IOError, AttributeError):
+            entry = {}
+        
+        samples = entry.get("samples") or []
+        logged = [(a, t) for name, a, t in _read_stats_log() if name == model_name]
+        
+        if not logged:
+            return entry["avg_ratio"] if samples else None
+        
+        recent = [(s["audio_duration"], s["transcription_time"]) for s in samples[-MAX_STATS_SAMPLES:]]
+        recent = (recent + logged)[-MAX_STATS_SAMPLES:]
     
-    save_transcription_stats(stats)
+    sum_audio = sum(a for a, _ in recent)
+    if sum_audio > 0:
+        return sum(t for _, t in recent) / sum_audio
+    return entry.get("avg_ratio", 1.0)
 
 
 def get_estimated_transcription_time(model_name: str, audio_duration: float) -> float:
@@ -164,24 +579,9 @@ def get_estimated_transcription_time(model_name: str, audio_duration: float) ->
     Returns:
         Estimated transcription time in seconds
     """
-    stats = load_transcription_stats()
-    
-    # Default ratios based on model complexity (rough estimates for CPU)
-    # Ratio = transcription_time / audio_duration
-    default_ratios = {
-        "tiny": 0.3,      # Very fast
-        "base": 0.5,      # Fast
-        "small": 1.0,     # About real-time
-        "medium": 2.5,    # Slower
-        "large-v3": 5.0,  # Slowest
-    }
-    
-    if model_name in stats and stats[model_name].get("samples"):
-        # Use historical average ratio
-        ratio = stats[model_name]["avg_ratio"]
-    else:
-        # Use default estimate
-        ratio = default_ratios.get(model_name, 1.0)
+    ratio = _historical_ratio(model_name)
+    if ratio is not None:
+        return audio_duration * ratio
     
-    return audio_duration * ratio
+    return audio_duration * _DEFAULT_RATIOS.get(model_name, 1.0)
 
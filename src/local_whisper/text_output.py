@@ -1,7 +1,60 @@
 """Text output module for typing text into the active window."""
 
-import pyautogui
+import keyboard
 import time
+from functools import lru_cache
+from typing import Optional
+
+
+# Intervals at or below this are typed in one backend call without per-key sleeps
+FAST_TYPING_INTERVAL = 0.001
+
+# Default delay before typing, giving the target window time to take focus
+_DEFAULT_DELAY = 0.1
+
+
+def _pyautogui():
+    """
+    Import pyautogui on first use.
+    
+    pyautogui pulls in its screenshot and OS backends at import time, so it is
+    only loaded once text is actually typed rather than at app startup.
+    
+    Returns:
+        The pyautogui module with its failsafe disabled
+    """
+    import pyautogui
+    
+    # Disable pyautogui failsafe (move mouse to corner to abort)
+    # We handle this differently in our app
+    pyautogui.FAILSAFE = False
+    return pyautogui
+
+
+@lru_cache(maxsize=64)
+def _scan_code(key: str) -> Optional[int]:
+    """
+    Resolve a key name to its scan code, caching the lookup.
+    
+    keyboard.send() presses only the bare scan code and drops any modifier the
+    key needs (e.g. Shift for 'A' or '!'), so only named keys and lowercase
+    letters are resolved; everything else is left to pyautogui.
+    
+    Args:
+        key: Key name (e.g., 'enter', 'ctrl')
+        
+    Returns:
+        The key's scan code, or None if the key needs a modifier or keyboard
+        can't map it on this platform
+    """
+    if not (key.isascii() and key.islower()):
+        return None
+    
+    try:
+        return keyboard.key_to_scan_codes(key)[0]
+    except (ValueError, ImportError):
+        # ImportError: keyboard needs root to map keys on Linux
+        return None
 
 
 class TextOutput:
@@ -15,11 +68,10 @@ class TextOutput:
             typing_interval: Delay between keystrokes in seconds
         """
         self.typing_interval = typing_interval
-        # Disable pyautogui failsafe (move mouse to corner to abort)
-        # We handle this differently in our app
-        pyautogui.FAILSAFE = False
+        # Monotonic time the last typing call finished
+        self._last_type_end = float("-inf")
     
-    def type_text(self, text: str, delay_before: float = 0.1) -> None:
+    def type_text(self, text: str, delay_before: float = _DEFAULT_DELAY) -> None:
         """
         Type text into the currently active window.
         
@@ -30,16 +82,20 @@ class TextOutput:
         if not text:
             return
         
-        # Small delay to ensure the target window is focused
-        time.sleep(delay_before)
+        self._wait_for_focus(delay_before)
+        
+        if self.typing_interval <= FAST_TYPING_INTERVAL:
+            keyboard.write(text, delay=0)
+        else:
+            # Use typewrite for ASCII characters, but we need write() for unicode
+            # pyautogui.write() handles unicode better
+            _pyautogui().write(text, interval=self.typing_interval)
         
-        # Use typewrite for ASCII characters, but we need write() for unicode
-        # pyautogui.write() handles unicode better
-        pyautogui.write(text, interval=self.typing_interval)
+        self._last_type_end = time.monotonic()
     
-    def type_text_fast(self, text: str, delay_before: float = 0.1) -> None:
+    def type_text_fast(self, text: str, delay_before: float = _DEFAULT_DELAY) -> None:
         """
-        Type text quickly using clipboard-like behavior.
+        Type text quickly in a single keyboard call with no per-key delay.
         This is faster but may not work in all applications.
         
         Args:
@@ -49,10 +105,28 @@ class TextOutput:
         if not text:
             return
         
-        time.sleep(delay_before)
+        self._wait_for_focus(delay_before)
+        
+        # keyboard.write() sends unicode key events directly, skipping
+        # pyautogui's per-character sleep loop
+        keyboard.write(text, delay=0)
+        
+        self._last_type_end = time.monotonic()
+    
+    def _wait_for_focus(self, delay_before: float) -> None:
+        """
+        Sleep so the target window can take focus before typing.
+        
+        Calls that follow the previous one within the delay window are typed
+        into the already focused window, so they skip the sleep.
+        
+        Args:
+            delay_before: Delay before starting to type
+        """
+        if delay_before <= 0 or time.monotonic() - self._last_type_end < delay_before:
+            return
         
-        # For faster typing, use hotkey with lower interval
-        pyautogui.write(text, interval=0.001)
+        time.sleep(delay_before)
     
     @staticmethod
     def press_key(key: str) -> None:
@@ -62,7 +136,12 @@ class TextOutput:
         Args:
             key: The key to press (e.g., 'enter', 'tab', 'backspace')
         """
-        pyautogui.press(key)
+        code = _scan_code(key)
+        if code is None:
+            _pyautogui().press(key)
+            return
+        
+        keyboard.send(code)
     
     @staticmethod
     def hotkey(*keys: str) -> None:
@@ -72,5 +151,11 @@ class TextOutput:
         Args:
             keys: Keys to press simultaneously (e.g., 'ctrl', 'v')
         """
-        pyautogui.hotkey(*keys)
+        codes = tuple(_scan_code(key) for key in keys)
+        if None in codes:
+            _pyautogui().hotkey(*keys)
+            return
+        
+        # Presses the keys in order and releases them in reverse
+        keyboard.send(codes)
 
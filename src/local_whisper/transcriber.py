@@ -3,6 +3,7 @@
 import os
 import numpy as np
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 from faster_whisper import WhisperModel
@@ -20,22 +21,46 @@ MODEL_REPO_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_model_directory() -> Path:
-    """Get the directory for storing Whisper models."""
+    """
+    Get the directory for storing Whisper models.
+    
+    The path is resolved from APPDATA on the first call and the models
+    directory is created then; later calls return that same Path, even if
+    APPDATA changes. Call reset_path_cache() to resolve it again.
+    """
     appdata = os.environ.get('APPDATA', os.path.expanduser('~'))
     model_dir = Path(appdata) / 'local-whisper' / 'models'
     model_dir.mkdir(parents=True, exist_ok=True)
     return model_dir
 
 
+@lru_cache(maxsize=32)
 def get_model_path(model_name: str) -> Path:
-    """Get the path where a specific model would be stored."""
+    """
+    Get the path where a specific model would be stored.
+    
+    Paths are memoized per model name under the cached model directory, so
+    repeated lookups (e.g. from is_model_downloaded) return the same Path.
+    """
     repo_name = MODEL_REPO_MAP.get(model_name, model_name)
     # HuggingFace stores models in models--org--name format
     cache_name = f"models--{repo_name.replace('/', '--')}"
     return get_model_directory() / cache_name
 
 
+def reset_path_cache() -> None:
+    """
+    Clear the get_model_directory() and get_model_path() caches.
+    
+    Both keep paths derived from APPDATA, so tests that point APPDATA at a
+    new directory must call this before looking up model paths.
+    """
+    get_model_directory.cache_clear()
+    get_model_path.cache_clear()
+
+
 def is_model_downloaded(model_name: str) -> bool:
     """
     Check if a model is already downloaded locally.
@@ -67,16 +92,22 @@ def is_model_downloaded(model_name: str) -> bool:
     return False
 
 
+# (divisor, format) for KB, MB and GB, indexed by (bit_length - 1) // 10 - 1;
+# values below 1 KB are printed as plain bytes
+_BYTE_UNITS = (
+    (1024, "{:.1f} KB"),
+    (1024 ** 2, "{:.1f} MB"),
+    (1024 ** 3, "{:.2f} GB"),
+)
+
+
 def _format_bytes(bytes_val: int) -> str:
     """Format bytes into human-readable string."""
-    if bytes_val < 1024:
+    unit = min(max(int(bytes_val).bit_length() - 1, 0) // 10, 3)
+    if unit == 0:
         return f"{bytes_val} B"
-    elif bytes_val < 1024 * 1024:
-        return f"{bytes_val / 1024:.1f} KB"
-    elif bytes_val < 1024 * 1024 * 1024:
-        return f"{bytes_val / (1024 * 1024):.1f} MB"
-    else:
-        return f"{bytes_val / (1024 * 1024 * 1024):.2f} GB"
+    divisor, fmt = _BYTE_UNITS[unit - 1]
+    return fmt.format(bytes_val / divisor)
 
 
 class _ProgressTracker(tqdm):
@@ -415,8 +446,13 @@ class Transcriber:
     
     @staticmethod
     def get_available_models() -> list[dict]:
-        """Get list of available Whisper models with their sizes."""
-        return Transcriber.AVAILABLE_MODELS.copy()
+        """
+        Get list of available Whisper models with their sizes.
+        
+        Each call returns new dicts, so callers can modify the result without
+        affecting AVAILABLE_MODELS.
+        """
+        return [dict(model) for model in Transcriber.AVAILABLE_MODELS]
     
     @staticmethod
     def is_model_downloaded(model_name: str) -> bool:
@@ -1,5 +1,7 @@
 """Shared styles for Local Whisper UI."""
 
+from functools import lru_cache
+
 # Color palette
 COLORS = {
     "background": "#1a1a2e",
@@ -277,7 +279,8 @@ FLOATING_INDICATOR_STYLES = f"""
 """
 
 
+@lru_cache(maxsize=None)
 def get_all_styles() -> str:
-    """Get all combined styles for the application."""
+    """Get all combined styles for the application (built once, then cached)."""
     return BASE_STYLES + MAIN_VIEW_STYLES + MODEL_SELECTOR_STYLES
 
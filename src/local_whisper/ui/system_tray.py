@@ -1,63 +1,124 @@
 """System tray icon for Local Whisper."""
 
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush
-from PyQt6.QtCore import pyqtSignal, QSize
+from PyQt6.QtGui import QAction, QIcon, QPixmap, QImage, QColor
+from PyQt6.QtCore import QTimer, pyqtSignal
 
 
-def create_tray_icon(recording: bool = False) -> QIcon:
+_ICON_SIZE = 64
+_SUPERSAMPLING = 4  # samples per pixel along each axis, for antialiased edges
+
+# Half the width of the 1px outline QPainter draws around each filled shape
+_PEN_OUTSET = 0.5
+
+# Recording state changes within this window are coalesced into one icon update
+_RECORDING_DEBOUNCE_MS = 30
+
+
+def _rect(x: np.ndarray, y: np.ndarray, left: int, top: int, width: int, height: int) -> np.ndarray:
+    """Mask of the grid points inside a rectangle grown by the pen outset, with bevelled corners."""
+    # Distance outside the unpadded rectangle along each axis
+    dx = np.maximum(np.maximum(left - x, x - (left + width)), 0)
+    dy = np.maximum(np.maximum(top - y, y - (top + height)), 0)
+    return (dx < _PEN_OUTSET) & (dy < _PEN_OUTSET) & (dx + dy < _PEN_OUTSET)
+
+
+def _coverage_masks(size: int, samples: int) -> tuple[np.ndarray, np.ndarray]:
     """
-    Create a simple tray icon programmatically.
+    Compute per-pixel coverage (0.0-1.0) of the icon's circle and microphone.
     
-    Args:
-        recording: Whether to show recording state (red) or idle state (green)
+    Shapes are evaluated on a supersampled grid and averaged down to get
+    antialiased edges. Each shape is grown by _PEN_OUTSET on every side to
+    match the filled-and-outlined shapes QPainter drew for this icon; edges
+    stay within a fraction of a pixel's coverage of QPainter's, whose curves
+    are Bezier approximations.
     
     Returns:
-        QIcon for the system tray
+        Tuple of (circle coverage, microphone coverage), each of shape (size, size)
     """
-    size = 64
-    pixmap = QPixmap(QSize(size, size))
-    pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-    
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    
-    # Draw circle
-    if recording:
-        color = QColor("#ff4757")  # Red for recording
-    else:
-        color = QColor("#00d4aa")  # Green/teal for idle
-    
-    painter.setBrush(QBrush(color))
-    painter.setPen(color)
+    coords = (np.arange(size * samples) + 0.5) / samples
+    y, x = np.meshgrid(coords, coords, indexing="ij")
     
+    # Circle
     margin = 8
-    painter.drawEllipse(margin, margin, size - 2 * margin, size - 2 * margin)
-    
-    # Draw microphone icon (simple representation)
-    painter.setBrush(QBrush(QColor("#1a1a2e")))
-    painter.setPen(QColor("#1a1a2e"))
+    center = size / 2
+    radius = size / 2 - margin + _PEN_OUTSET
+    circle = (x - center) ** 2 + (y - center) ** 2 <= radius ** 2
     
-    # Microphone body
+    # Microphone body (rounded rectangle)
     mic_width = 16
     mic_height = 24
+    mic_radius = 8
     mic_x = (size - mic_width) // 2
     mic_y = size // 2 - mic_height // 2 - 4
-    painter.drawRoundedRect(mic_x, mic_y, mic_width, mic_height, 8, 8)
+    dx = np.maximum(np.abs(x - (mic_x + mic_width / 2)) - (mic_width / 2 - mic_radius), 0)
+    dy = np.maximum(np.abs(y - (mic_y + mic_height / 2)) - (mic_height / 2 - mic_radius), 0)
+    mic = dx ** 2 + dy ** 2 <= (mic_radius + _PEN_OUTSET) ** 2
     
     # Microphone stand
     stand_width = 4
     stand_x = (size - stand_width) // 2
-    painter.drawRect(stand_x, mic_y + mic_height, stand_width, 8)
+    mic |= _rect(x, y, stand_x, mic_y + mic_height, stand_width, 8)
     
     # Base
     base_width = 20
     base_x = (size - base_width) // 2
-    painter.drawRect(base_x, mic_y + mic_height + 8, base_width, 4)
+    mic |= _rect(x, y, base_x, mic_y + mic_height + 8, base_width, 4)
+    
+    def downsample(mask: np.ndarray) -> np.ndarray:
+        return mask.reshape(size, samples, size, samples).mean(axis=(1, 3), dtype=np.float32)
+    
+    return downsample(circle), downsample(mic)
+
+
+_CIRCLE_COVERAGE, _MIC_COVERAGE = _coverage_masks(_ICON_SIZE, _SUPERSAMPLING)
+
+
+def _premultiplied_bgra(color: str) -> np.ndarray:
+    """Convert a hex color to an opaque BGRA pixel (ARGB32 byte order on little-endian)."""
+    qcolor = QColor(color)
+    return np.array([qcolor.blue(), qcolor.green(), qcolor.red(), 255], dtype=np.float32)
+
+
+def create_tray_icon(recording: bool = False) -> QIcon:
+    """
+    Create a simple tray icon programmatically.
     
-    painter.end()
+    Icons are rendered once per state and shared between callers.
     
-    return QIcon(pixmap)
+    Args:
+        recording: Whether to show recording state (red) or idle state (green)
+    
+    Returns:
+        QIcon for the system tray
+    """
+    return _render_tray_icon(bool(recording))
+
+
+@lru_cache(maxsize=2)
+def _render_tray_icon(recording: bool) -> QIcon:
+    """Fill the tray icon pixels for the given recording state."""
+    # Circle color: red for recording, green/teal for idle
+    circle_color = _premultiplied_bgra("#ff4757" if recording else "#00d4aa")
+    mic_color = _premultiplied_bgra("#1a1a2e")
+    
+    # Composite the microphone over the circle (premultiplied "source over")
+    pixels = (
+        mic_color * _MIC_COVERAGE[..., None]
+        + circle_color * (_CIRCLE_COVERAGE * (1.0 - _MIC_COVERAGE))[..., None]
+    )
+    
+    image = QImage(_ICON_SIZE, _ICON_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+    buffer = image.bits()
+    buffer.setsize(image.sizeInBytes())
+    target = np.frombuffer(buffer, dtype=np.uint8).reshape(_ICON_SIZE, image.bytesPerLine())
+    target[:, :_ICON_SIZE * 4] = np.rint(pixels).astype(np.uint8).reshape(_ICON_SIZE, _ICON_SIZE * 4)
+    
+    return QIcon(QPixmap.fromImage(image))
 
 
 class SystemTray(QSystemTrayIcon):
@@ -70,8 +131,20 @@ class SystemTray(QSystemTrayIcon):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Render both state icons once; set_recording() just swaps them
+        self._idle_icon = create_tray_icon(recording=False)
+        self._recording_icon = create_tray_icon(recording=True)
+        
         # Set initial icon
-        self.setIcon(create_tray_icon(recording=False))
+        self.setIcon(self._idle_icon)
+        self._recording = False
+        
+        # Coalesces bursts of set_recording() calls; see set_recording()
+        self._pending_recording: Optional[bool] = None
+        self._recording_debounce = QTimer(self)
+        self._recording_debounce.setSingleShot(True)
+        self._recording_debounce.setInterval(_RECORDING_DEBOUNCE_MS)
+        self._recording_debounce.timeout.connect(self._apply_pending_recording)
         self.setToolTip("local-whisper - Press Ctrl+Space to record")
         
         # Create context menu
@@ -85,17 +158,27 @@ class SystemTray(QSystemTrayIcon):
         menu = QMenu()
         
         # Show action
-        show_action = menu.addAction("Show Window")
-        show_action.triggered.connect(self.show_window_requested.emit)
+        self._show_action = menu.addAction("Show Window")
+        self._show_action.triggered.connect(self.show_window_requested.emit)
         
         menu.addSeparator()
         
         # Exit action
-        exit_action = menu.addAction("Exit")
-        exit_action.triggered.connect(self.exit_requested.emit)
+        self._exit_action = menu.addAction("Exit")
+        self._exit_action.triggered.connect(self.exit_requested.emit)
         
         self.setContextMenu(menu)
     
+    @property
+    def show_action(self) -> QAction:
+        """Get the context menu's 'Show Window' action."""
+        return self._show_action
+    
+    @property
+    def exit_action(self) -> QAction:
+        """Get the context menu's 'Exit' action."""
+        return self._exit_action
+    
     def _on_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """Handle tray icon activation (double-click)."""
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
@@ -105,10 +188,39 @@ class SystemTray(QSystemTrayIcon):
         """
         Update the tray icon to show recording state.
         
+        The first change is applied immediately. Further changes within
+        _RECORDING_DEBOUNCE_MS are coalesced and only the latest state is
+        applied when the window ends, so rapid toggling costs at most two
+        icon updates.
+        
         Args:
             recording: Whether currently recording
         """
-        self.setIcon(create_tray_icon(recording=recording))
+        if self._recording_debounce.isActive():
+            self._pending_recording = recording
+            return
+        
+        self._apply_recording(recording)
+        self._recording_debounce.start()
+    
+    def _apply_pending_recording(self) -> None:
+        """Apply the latest state requested during the debounce window."""
+        if self._pending_recording is None:
+            return
+        
+        recording = self._pending_recording
+        self._pending_recording = None
+        self._apply_recording(recording)
+        # Keep coalescing while the burst continues
+        self._recording_debounce.start()
+    
+    def _apply_recording(self, recording: bool) -> None:
+        """Set the icon and tooltip for a recording state."""
+        if recording == self._recording:
+            return
+        self._recording = recording
+        
+        self.setIcon(self._recording_icon if recording else self._idle_icon)
         
         if recording:
             self.setToolTip("local-whisper - Recording... Press Ctrl+Space to stop")
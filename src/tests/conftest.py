@@ -1,9 +1,11 @@
 """Shared pytest fixtures for local_whisper tests."""
 
 import os
+import shutil
 import sys
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from typing import Generator
 
@@ -13,13 +15,71 @@ import numpy as np
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Render Qt widgets offscreen so tests don't round-trip through the display server.
+# Must be set before PyQt6 is imported anywhere in the test session.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QT_OPENGL", "software")
+os.environ.setdefault("QT_LOGGING_RULES", "*=false")
+
+# Set SKIP_QT=1 to leave the pure UI test modules out of collection entirely,
+# so runs that don't touch the UI never import the widget stack.
+collect_ignore_glob = []
+if os.environ.get("SKIP_QT"):
+    collect_ignore_glob = [
+        "test_floating_indicator.py",
+        "test_main_window.py",
+        "test_system_tray.py",
+    ]
+
+# Import the heavier application modules once up front so their import cost
+# is paid in one place instead of inside whichever test module is collected first.
+import local_whisper.hotkey_handler  # noqa: E402,F401
+if not os.environ.get("SKIP_QT"):
+    import local_whisper.ui.main_window  # noqa: E402,F401
+    import local_whisper.ui.floating_indicator  # noqa: E402,F401
+
 
 # ============================================================================
 # Settings Fixtures
 # ============================================================================
 
+def _reset_appdata_caches() -> None:
+    """
+    Drop every cached path and file derived from APPDATA.
+    
+    Only modules that are already imported are reset; a module imported later
+    starts with empty caches anyway, and importing transcriber here would pull
+    faster_whisper into runs that never use it.
+    """
+    settings = sys.modules.get("local_whisper.settings")
+    if settings is not None:
+        settings.reset_cache()
+    
+    transcriber = sys.modules.get("local_whisper.transcriber")
+    if transcriber is not None:
+        transcriber.reset_path_cache()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_appdata(tmp_path_factory) -> Generator[Path, None, None]:
+    """
+    Point APPDATA at a session-wide temporary directory.
+    
+    Tests that don't request temp_settings_dir (e.g. constructing a Transcriber,
+    which resolves the model directory) then never touch the real user profile.
+    The directory is created once per session; temp_settings_dir still gives
+    individual tests their own fresh directory on top of it.
+    """
+    appdata = tmp_path_factory.mktemp("appdata")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("APPDATA", str(appdata))
+        _reset_appdata_caches()
+        yield appdata
+    _reset_appdata_caches()
+
+
 @pytest.fixture
-def temp_settings_dir(tmp_path: Path, monkeypatch) -> Path:
+def temp_settings_dir(tmp_path: Path, monkeypatch) -> Generator[Path, None, None]:
     """
     Create a temporary settings directory and patch APPDATA to use it.
     
@@ -31,7 +91,10 @@ def temp_settings_dir(tmp_path: Path, monkeypatch) -> Path:
     # Patch APPDATA environment variable
     monkeypatch.setenv("APPDATA", str(tmp_path))
     
-    return settings_dir
+    # Start from empty caches (settings/model paths, file contents) and drop pending writes afterwards
+    _reset_appdata_caches()
+    yield settings_dir
+    _reset_appdata_caches()
 
 
 @pytest.fixture
@@ -42,6 +105,19 @@ def temp_model_dir(temp_settings_dir: Path) -> Path:
     return model_dir
 
 
+@pytest.fixture(scope="session")
+def shared_model_dir(session_appdata: Path) -> Path:
+    """
+    Session-wide models directory for tests that only read from it.
+    
+    Created once instead of per test. Tests that create model files must use
+    temp_model_dir so nothing leaks into other tests.
+    """
+    model_dir = session_appdata / "local-whisper" / "models"
+    model_dir.mkdir(parents=True, exist_ok=True)
+    return model_dir
+
+
 # ============================================================================
 # Audio Mocking Fixtures
 # ============================================================================
@@ -93,6 +169,14 @@ def sample_audio_data() -> np.ndarray:
     return audio
 
 
+@pytest.fixture(scope="session")
+def silence_1s() -> np.ndarray:
+    """One second of 16kHz silence, shared across the session and read-only."""
+    audio = np.zeros(16000, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
 # ============================================================================
 # Keyboard/Hotkey Mocking Fixtures
 # ============================================================================
@@ -117,13 +201,42 @@ def mock_keyboard(monkeypatch):
         else:
             raise KeyError(f"Hotkey {hotkey} not registered")
     
+    # Track what was typed
+    mock_kb.typed_texts = []
+    
+    def write(text, delay=0):
+        mock_kb.typed_texts.append(text)
+    
     mock_kb.add_hotkey = MagicMock(side_effect=add_hotkey)
     mock_kb.remove_hotkey = MagicMock(side_effect=remove_hotkey)
+    # Scan codes returned by key_to_scan_codes
+    scan_codes = {
+        "enter": 28, "tab": 15, "backspace": 14, "escape": 1, "esc": 1,
+        "space": 57, "ctrl": 29, "shift": 42, "alt": 56,
+        "a": 30, "c": 46, "v": 47, "z": 44,
+    }
+    
+    def key_to_scan_codes(key):
+        if key not in scan_codes:
+            raise ValueError(f"Key {key!r} is not mapped to any known key.")
+        return (scan_codes[key],)
+    
+    mock_kb.scan_codes = scan_codes
+    mock_kb.write = MagicMock(side_effect=write)
+    mock_kb.send = MagicMock()
+    mock_kb.key_to_scan_codes = MagicMock(side_effect=key_to_scan_codes)
     
     monkeypatch.setattr("keyboard.add_hotkey", mock_kb.add_hotkey)
     monkeypatch.setattr("keyboard.remove_hotkey", mock_kb.remove_hotkey)
+    monkeypatch.setattr("keyboard.write", mock_kb.write)
+    monkeypatch.setattr("keyboard.send", mock_kb.send)
+    monkeypatch.setattr("keyboard.key_to_scan_codes", mock_kb.key_to_scan_codes)
     
-    return mock_kb
+    # Scan code lookups are cached per process; start and end with an empty cache
+    from local_whisper.text_output import _scan_code
+    _scan_code.cache_clear()
+    yield mock_kb
+    _scan_code.cache_clear()
 
 
 # ============================================================================
@@ -167,29 +280,37 @@ def mock_pyautogui(monkeypatch):
 # Whisper Model Mocking Fixtures
 # ============================================================================
 
+class _FakeWhisperModel:
+    """
+    Plain stand-in for faster_whisper.WhisperModel.
+    
+    Much cheaper to build than a MagicMock; transcribe() returns a fresh
+    segment generator on every call, like the real model.
+    """
+    
+    def __init__(self):
+        self.segments = [
+            SimpleNamespace(text=" Hello, this is a test transcription.", start=0.0, end=2.0),
+        ]
+        self.info = SimpleNamespace(language="en")
+        self.transcribe_calls = []
+    
+    def transcribe(self, audio, **kwargs):
+        self.transcribe_calls.append((audio, kwargs))
+        return (segment for segment in self.segments), self.info
+
+
 @pytest.fixture
 def mock_whisper_model(monkeypatch):
     """
     Mock the WhisperModel for testing transcription without loading real model.
     """
-    mock_model = MagicMock()
-    
-    # Mock segment for transcription results
-    mock_segment = MagicMock()
-    mock_segment.text = " Hello, this is a test transcription."
-    mock_segment.start = 0.0
-    mock_segment.end = 2.0
-    
-    # Mock transcribe to return segments
-    mock_info = MagicMock()
-    mock_info.language = "en"
-    mock_model.transcribe.return_value = ([mock_segment], mock_info)
+    model = _FakeWhisperModel()
     
     # Patch WhisperModel class
-    mock_whisper_class = MagicMock(return_value=mock_model)
-    monkeypatch.setattr("faster_whisper.WhisperModel", mock_whisper_class)
+    monkeypatch.setattr("faster_whisper.WhisperModel", lambda *args, **kwargs: model)
     
-    return mock_model
+    return model
 
 
 @pytest.fixture
@@ -220,24 +341,51 @@ def mock_hf_api(monkeypatch):
 # Fake Model Directory Fixtures
 # ============================================================================
 
-@pytest.fixture
-def fake_downloaded_model(temp_model_dir: Path) -> str:
+_FAKE_MODEL_NAME = "tiny"
+_FAKE_MODEL_CACHE_NAME = "models--Systran--faster-whisper-tiny"
+
+
+@pytest.fixture(scope="session")
+def fake_model_template(tmp_path_factory) -> Path:
     """
-    Create a fake downloaded model in the temp directory.
+    Build the fake downloaded model tree once per session.
     
-    Returns the model name that was created.
+    Returns the model's cache directory (models--org--name), which contains
+    snapshots/<hash>/model.bin like a real HuggingFace download.
     """
-    model_name = "tiny"
-    repo_name = "Systran/faster-whisper-tiny"
-    cache_name = f"models--{repo_name.replace('/', '--')}"
-    
-    model_path = temp_model_dir / cache_name / "snapshots" / "abc123"
-    model_path.mkdir(parents=True, exist_ok=True)
+    template = tmp_path_factory.mktemp("model-template") / _FAKE_MODEL_CACHE_NAME
+    snapshot = template / "snapshots" / "abc123"
+    snapshot.mkdir(parents=True)
     
     # Create fake model.bin file
-    (model_path / "model.bin").write_bytes(b"fake model data")
+    (snapshot / "model.bin").write_bytes(b"fake model data")
     
-    return model_name
+    return template
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a file, copying it where hard links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture
+def fake_downloaded_model(temp_model_dir: Path, fake_model_template: Path) -> str:
+    """
+    Create a fake downloaded model in the temp directory.
+    
+    The session template is hard-linked into place rather than rebuilt.
+    
+    Returns the model name that was created.
+    """
+    shutil.copytree(
+        fake_model_template,
+        temp_model_dir / _FAKE_MODEL_CACHE_NAME,
+        copy_function=_link_or_copy,
+    )
+    return _FAKE_MODEL_NAME
 
 
 # ============================================================================
@@ -291,3 +439,39 @@ def mock_app_dependencies(mock_sounddevice, mock_keyboard, mock_pyautogui, mock_
         'settings_dir': temp_settings_dir
     }
 
+
+
+# ============================================================================
+# Slow Qt Test Selection
+# ============================================================================
+
+# Widget-heavy test modules that are tagged with the qt_slow marker
+QT_SLOW_MODULES = ("test_floating_indicator.py", "test_main_window.py")
+
+
+def pytest_addoption(parser):
+    """Register the --skip-qt-slow command line option."""
+    parser.addoption(
+        "--skip-qt-slow",
+        action="store_true",
+        default=False,
+        help="Skip tests marked qt_slow (widget-heavy UI tests)",
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line("markers", "qt_slow: widget-heavy Qt UI test")
+    config.addinivalue_line("markers", "slow: model downloads or other I/O-heavy test")
+    config.addinivalue_line("markers", "numpy: test that builds or transcribes audio arrays")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag tests in widget-heavy modules as qt_slow and optionally skip them."""
+    skip_qt_slow = config.getoption("--skip-qt-slow")
+    
+    for item in items:
+        if item.path.name in QT_SLOW_MODULES:
+            item.add_marker(pytest.mark.qt_slow)
+            if skip_qt_slow:
+                item.add_marker(pytest.mark.skip(reason="qt-slow"))
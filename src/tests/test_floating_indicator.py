@@ -1,9 +1,10 @@
 """Tests for the floating_indicator module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
-from PyQt6.QtCore import Qt
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QEvent, QPointF
 from PyQt6.QtWidgets import QApplication
 
 from local_whisper.ui.floating_indicator import (
@@ -13,6 +14,40 @@ from local_whisper.ui.floating_indicator import (
 )
 
 
+# Shared press position for the dragging tests
+_DRAG_POS = QPointF(10, 10)
+
+
+@pytest.fixture(scope="class")
+def shared_indicator(qapp):
+    """Create one FloatingIndicator shared by every test in a class."""
+    indicator = FloatingIndicator()
+    yield indicator
+    indicator.hide_indicator()
+    indicator.deleteLater()
+    # processEvents() doesn't deliver DeferredDelete outside a running event loop
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert sip.isdeleted(indicator)
+
+
+@pytest.fixture(scope="class")
+def shared_level_widget(qapp):
+    """
+    Create one default AudioLevelWidget shared by every test in a class.
+    
+    The bars are children of the widget, so deleting the parent once
+    tears down the whole tree.
+    """
+    widget = AudioLevelWidget()
+    bars = list(widget._bars)
+    yield widget
+    widget.deleteLater()
+    # processEvents() doesn't deliver DeferredDelete outside a running event loop
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert sip.isdeleted(widget)
+    assert all(sip.isdeleted(bar) for bar in bars)
+
+
 class TestAudioLevelBar:
     """Tests for AudioLevelBar widget."""
     
@@ -55,41 +90,35 @@ class TestAudioLevelWidget:
         
         assert len(widget._bars) == 5
     
-    def test_default_num_bars(self, qtbot):
+    def test_default_num_bars(self, shared_level_widget):
         """Test default number of bars is 7."""
-        widget = AudioLevelWidget()
-        qtbot.addWidget(widget)
-        
-        assert len(widget._bars) == 7
+        assert len(shared_level_widget._bars) == 7
     
-    def test_set_audio_level(self, qtbot):
+    def test_set_audio_level(self, shared_level_widget):
         """Test setting audio level updates all bars."""
-        widget = AudioLevelWidget(num_bars=3)
-        qtbot.addWidget(widget)
-        
-        widget.set_audio_level(0.5)
+        shared_level_widget.set_audio_level(0.5)
         
         # All bars should have some level set
-        for bar in widget._bars:
+        for bar in shared_level_widget._bars:
             assert bar._target_level >= 0.0
 
 
 class TestFloatingIndicator:
     """Tests for FloatingIndicator window."""
     
-    def test_init(self, qtbot):
+    @pytest.fixture(autouse=True)
+    def indicator(self, shared_indicator):
+        """Reuse the class-wide indicator, reset to its hidden idle state."""
+        shared_indicator.hide_indicator()
+        return shared_indicator
+    
+    def test_init(self, indicator):
         """Test FloatingIndicator initialization."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         assert indicator._is_recording is False
         assert indicator._is_transcribing is False
     
-    def test_window_flags(self, qtbot):
+    def test_window_flags(self, indicator):
         """Test that window has correct flags for always-on-top and no focus stealing."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         flags = indicator.windowFlags()
         
         # Should be frameless
@@ -99,11 +128,8 @@ class TestFloatingIndicator:
         # Should be a tool window
         assert flags & Qt.WindowType.Tool
     
-    def test_show_recording(self, qtbot):
+    def test_show_recording(self, indicator):
         """Test showing recording state."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_recording()
         
         assert indicator._is_recording is True
@@ -112,11 +138,8 @@ class TestFloatingIndicator:
         assert indicator._transcribing_widget.isVisible() is False
         assert indicator.isVisible() is True
     
-    def test_show_transcribing(self, qtbot):
+    def test_show_transcribing(self, indicator):
         """Test showing transcribing state."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_transcribing()
         
         assert indicator._is_recording is False
@@ -125,11 +148,8 @@ class TestFloatingIndicator:
         assert indicator._transcribing_widget.isVisible() is True
         assert indicator.isVisible() is True
     
-    def test_hide_indicator(self, qtbot):
+    def test_hide_indicator(self, indicator):
         """Test hiding the indicator."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_recording()
         indicator.hide_indicator()
         
@@ -137,55 +157,40 @@ class TestFloatingIndicator:
         assert indicator._is_transcribing is False
         assert indicator.isVisible() is False
     
-    def test_update_audio_level(self, qtbot):
+    def test_update_audio_level(self, indicator):
         """Test updating audio level during recording."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_recording()
         indicator.update_audio_level(0.75)
         
         # Should not crash, audio level widget handles the update
         assert indicator._is_recording is True
     
-    def test_update_audio_level_ignored_when_not_recording(self, qtbot):
+    def test_update_audio_level_ignored_when_not_recording(self, indicator):
         """Test that audio level updates are ignored when not recording."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         # Don't show recording, try to update level
         indicator.update_audio_level(0.5)
         
         # Should not crash, just ignore the update
         assert indicator._is_recording is False
     
-    def test_update_transcription_progress(self, qtbot):
+    def test_update_transcription_progress(self, indicator):
         """Test updating transcription progress."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_transcribing()
         indicator.update_transcription_progress(50.0, 5.0, 5.0)
         
         assert indicator._progress_bar.value() == 50
         assert "5s" in indicator._eta_label.text()
     
-    def test_update_transcription_progress_finishing(self, qtbot):
+    def test_update_transcription_progress_finishing(self, indicator):
         """Test transcription progress when finishing up."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         indicator.show_transcribing()
         indicator.update_transcription_progress(95.0, 9.5, 0.5)
         
         assert indicator._progress_bar.value() == 95
         assert "Finishing" in indicator._eta_label.text()
     
-    def test_update_transcription_progress_ignored_when_not_transcribing(self, qtbot):
+    def test_update_transcription_progress_ignored_when_not_transcribing(self, indicator):
         """Test that progress updates are ignored when not transcribing."""
-        indicator = FloatingIndicator()
-        qtbot.addWidget(indicator)
-        
         # Get initial value (QProgressBar defaults to -1 when not set)
         initial_value = indicator._progress_bar.value()
         
@@ -215,15 +220,12 @@ class TestFloatingIndicatorDragging:
         """Test that dragging starts on left mouse button press."""
         indicator = FloatingIndicator()
         qtbot.addWidget(indicator)
-        indicator.show()
         
         # Simulate mouse press
-        from PyQt6.QtGui import QMouseEvent
-        from PyQt6.QtCore import QPointF
-        
-        event = MagicMock()
-        event.button.return_value = Qt.MouseButton.LeftButton
-        event.position.return_value = QPointF(10, 10)
+        event = SimpleNamespace(
+            button=lambda: Qt.MouseButton.LeftButton,
+            position=lambda: _DRAG_POS,
+        )
         
         indicator.mousePressEvent(event)
         
@@ -233,12 +235,10 @@ class TestFloatingIndicatorDragging:
         """Test that dragging stops on left mouse button release."""
         indicator = FloatingIndicator()
         qtbot.addWidget(indicator)
-        indicator.show()
         
         indicator._dragging = True
         
-        event = MagicMock()
-        event.button.return_value = Qt.MouseButton.LeftButton
+        event = SimpleNamespace(button=lambda: Qt.MouseButton.LeftButton)
         
         indicator.mouseReleaseEvent(event)
         
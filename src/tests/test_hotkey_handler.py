@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import threading
 import time
 
-from local_whisper.hotkey_handler import HotkeyHandler
+from local_whisper.hotkey_handler import HotkeyHandler, _format_hotkey
 
 
 class TestHotkeyHandlerInit:
@@ -161,29 +161,27 @@ class TestHotkeyCallback:
 class TestGetHotkeyDisplay:
     """Tests for get_hotkey_display method."""
     
-    def test_formats_ctrl_space(self):
-        """Test formatting of ctrl+space."""
-        handler = HotkeyHandler(hotkey="ctrl+space")
+    @pytest.mark.parametrize("hotkey, expected", [
+        ("ctrl+space", "Ctrl + Space"),
+        ("alt+r", "Alt + R"),
+        ("ctrl+shift+a", "Ctrl + Shift + A"),
+    ])
+    def test_formats_hotkey(self, hotkey, expected):
+        """Test formatting of simple and complex hotkeys."""
+        handler = HotkeyHandler(hotkey=hotkey)
         
         result = handler.get_hotkey_display()
         
-        assert result == "Ctrl + Space"
+        assert result == expected
     
-    def test_formats_alt_r(self):
-        """Test formatting of alt+r."""
-        handler = HotkeyHandler(hotkey="alt+r")
-        
-        result = handler.get_hotkey_display()
+    def test_format_hotkey_is_cached(self):
+        """Test that repeated formatting of the same hotkey hits the cache."""
+        _format_hotkey.cache_clear()
         
-        assert result == "Alt + R"
-    
-    def test_formats_complex_hotkey(self):
-        """Test formatting of complex hotkey."""
-        handler = HotkeyHandler(hotkey="ctrl+shift+a")
-        
-        result = handler.get_hotkey_display()
+        _format_hotkey("ctrl+space")
+        _format_hotkey("ctrl+space")
         
-        assert result == "Ctrl + Shift + A"
+        assert _format_hotkey.cache_info().hits == 1
 
 
 class TestThreadSafety:
@@ -1,13 +1,19 @@
 """Tests for the settings module."""
 
 import json
+import os
+import threading
+import time
 import pytest
+from collections.abc import Mapping
 from pathlib import Path
 
+from local_whisper import settings as settings_module
 from local_whisper.settings import (
     get_settings_directory,
     get_settings_path,
     get_transcription_stats_path,
+    get_transcription_stats_log_path,
     get_default_settings,
     load_settings,
     save_settings,
@@ -17,6 +23,8 @@ from local_whisper.settings import (
     save_transcription_stats,
     record_transcription_time,
     get_estimated_transcription_time,
+    flush_settings,
+    reset_cache,
 )
 
 
@@ -54,11 +62,26 @@ class TestSettingsDirectory:
 class TestDefaultSettings:
     """Tests for default settings."""
     
-    def test_get_default_settings_returns_dict(self):
-        """Test that get_default_settings returns a dictionary."""
+    def test_get_default_settings_returns_mapping(self):
+        """Test that get_default_settings returns a mapping."""
         result = get_default_settings()
         
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
+    
+    def test_get_default_settings_is_shared_and_read_only(self):
+        """Test that defaults are one shared mapping that can't be modified."""
+        result = get_default_settings()
+        
+        assert get_default_settings() is result
+        with pytest.raises(TypeError):
+            result["selected_model"] = "tiny"
+    
+    def test_load_settings_defaults_are_mutable_copy(self, temp_settings_dir: Path):
+        """Test that load_settings returns a dict even when falling back to defaults."""
+        result = load_settings()
+        result["selected_model"] = "tiny"
+        
+        assert get_default_settings()["selected_model"] == "base"
     
     def test_get_default_settings_has_selected_model(self):
         """Test that default settings include selected_model."""
@@ -132,6 +155,7 @@ class TestSelectedModel:
     def test_set_selected_model_persists(self, temp_settings_dir: Path):
         """Test that selected model persists across calls."""
         set_selected_model("medium")
+        flush_settings()
         
         # Verify it's saved to file
         settings_path = get_settings_path()
@@ -139,6 +163,141 @@ class TestSelectedModel:
             saved = json.load(f)
         
         assert saved["selected_model"] == "medium"
+    
+    def test_get_selected_model_null_returns_default(self, temp_settings_dir: Path):
+        """Test that a null selected_model in the file falls back to the default."""
+        get_settings_path().write_text('{"selected_model": null}', encoding='utf-8')
+        
+        assert get_selected_model() == "base"
+
+
+class TestSettingsCache:
+    """Tests for the in-process settings cache and buffered writes."""
+    
+    def test_save_settings_is_buffered_until_flush(self, temp_settings_dir: Path):
+        """Test that saved settings reach the disk only after flushing."""
+        save_settings({"selected_model": "small"})
+        
+        assert not get_settings_path().exists()
+        assert load_settings()["selected_model"] == "small"
+        
+        flush_settings()
+        
+        with open(get_settings_path(), 'r', encoding='utf-8') as f:
+            assert json.load(f)["selected_model"] == "small"
+    
+    def test_load_settings_sees_external_changes(self, temp_settings_dir: Path):
+        """Test that a file changed on disk invalidates the cached copy."""
+        save_settings({"selected_model": "small"})
+        flush_settings()
+        assert load_settings()["selected_model"] == "small"
+        
+        settings_path = get_settings_path()
+        with open(settings_path, 'w', encoding='utf-8') as f:
+            json.dump({"selected_model": "medium", "extra": True}, f)
+        
+        assert load_settings()["extra"] is True
+    
+    def test_load_settings_sees_rewrite_with_same_mtime(self, temp_settings_dir: Path):
+        """Test that a rewrite within one mtime tick still invalidates the cache."""
+        save_settings({"selected_model": "small"})
+        flush_settings()
+        assert load_settings()["selected_model"] == "small"
+        
+        settings_path = get_settings_path()
+        st = settings_path.stat()
+        with open(settings_path, 'w', encoding='utf-8') as f:
+            json.dump({"selected_model": "medium"}, f)
+        os.utime(settings_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert load_settings()["selected_model"] == "medium"
+    
+    def test_loaded_settings_do_not_alias_cache(self, temp_settings_dir: Path):
+        """Test that mutating loaded settings doesn't change the cache."""
+        save_settings({"selected_model": "small"})
+        
+        load_settings()["selected_model"] = "tiny"
+        
+        assert load_settings()["selected_model"] == "small"
+    
+    def test_missing_file_created_externally_is_loaded(self, temp_settings_dir: Path):
+        """Test that a settings file created after a miss is picked up."""
+        assert load_settings() == get_default_settings()
+        
+        with open(get_settings_path(), 'w', encoding='utf-8') as f:
+            json.dump({"selected_model": "medium"}, f)
+        
+        assert load_settings()["selected_model"] == "medium"
+    
+    def test_flush_replaces_file_atomically(self, temp_settings_dir: Path, monkeypatch):
+        """Test that a failed write leaves the previous settings file intact."""
+        save_settings({"selected_model": "small"})
+        flush_settings()
+        
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(settings_module.os, "replace", failing_replace)
+        save_settings({"selected_model": "medium"})
+        with pytest.raises(OSError):
+            flush_settings()
+        
+        with open(get_settings_path(), 'r', encoding='utf-8') as f:
+            assert json.load(f)["selected_model"] == "small"
+        assert list(get_settings_directory().glob("*.tmp")) == []
+    
+    def test_flush_drops_unserializable_settings(self, temp_settings_dir: Path):
+        """Test that settings that can't be serialized are dropped instead of retried."""
+        save_settings({"selected_model": "small", "bad": object()})
+        
+        with pytest.raises(TypeError):
+            flush_settings()
+        
+        assert list(get_settings_directory().glob("*.tmp")) == []
+        assert not get_settings_path().exists()
+        
+        # Nothing is left pending
+        flush_settings()
+        assert load_settings() == get_default_settings()
+    
+    def test_flush_leaves_no_temp_file(self, temp_settings_dir: Path):
+        """Test that the temporary file is moved into place."""
+        save_settings({"selected_model": "small"})
+        flush_settings()
+        
+        assert list(get_settings_directory().glob("*.tmp")) == []
+    
+    def test_buffered_saves_share_one_flush_thread(self, temp_settings_dir: Path, monkeypatch):
+        """Test that repeated saves reuse one flush thread, which writes after the delay."""
+        monkeypatch.setattr(settings_module, "_FLUSH_DELAY", 0.01)
+        
+        for model in ("tiny", "base", "small"):
+            save_settings({"selected_model": model})
+        
+        flush_threads = [t for t in threading.enumerate() if t.name == settings_module._FLUSH_THREAD_NAME]
+        assert len(flush_threads) == 1
+        
+        # Wait for the debounced flush
+        settings_path = get_settings_path()
+        deadline = time.monotonic() + 5
+        while not settings_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["selected_model"] == "small"
+    
+    def test_flush_fsync_only_when_requested(self, temp_settings_dir: Path, monkeypatch):
+        """Test that files are fsynced only by a durable flush."""
+        fsync_calls = []
+        monkeypatch.setattr(settings_module.os, "fsync", fsync_calls.append)
+        
+        save_settings({"selected_model": "small"})
+        flush_settings()
+        assert fsync_calls == []
+        
+        save_settings({"selected_model": "medium"})
+        flush_settings(fsync=True)
+        assert len(fsync_calls) == 1
 
 
 class TestTranscriptionStats:
@@ -164,6 +323,31 @@ class TestTranscriptionStats:
         
         assert result == test_stats
     
+    def test_load_large_transcription_stats(self, temp_settings_dir: Path, monkeypatch):
+        """Test that stats files above the memory-map threshold load correctly."""
+        monkeypatch.setattr(settings_module, "_MMAP_THRESHOLD", 16)
+        test_stats = {
+            f"model-{i}": {
+                "samples": [{"audio_duration": 5.0, "transcription_time": 2.5}],
+                "avg_ratio": 0.5
+            }
+            for i in range(10)
+        }
+        
+        save_transcription_stats(test_stats)
+        reset_cache()
+        
+        assert load_transcription_stats() == test_stats
+    
+    def test_load_large_invalid_transcription_stats(self, temp_settings_dir: Path, monkeypatch):
+        """Test that a corrupted stats file above the threshold returns empty dict."""
+        monkeypatch.setattr(settings_module, "_MMAP_THRESHOLD", 16)
+        
+        with open(get_transcription_stats_path(), 'w', encoding='utf-8') as f:
+            f.write("{ not valid json " * 4)
+        
+        assert load_transcription_stats() == {}
+    
     def test_load_transcription_stats_handles_invalid_json(self, temp_settings_dir: Path):
         """Test that load_transcription_stats handles corrupted JSON."""
         stats_path = get_transcription_stats_path()
@@ -208,11 +392,133 @@ class TestRecordTranscriptionTime:
         stats = load_transcription_stats()
         
         assert len(stats["small"]["samples"]) == 20
+    
+    def test_record_transcription_time_keeps_running_sums(self, temp_settings_dir: Path):
+        """Test that running sums track only the retained samples."""
+        for i in range(25):
+            record_transcription_time("small", audio_duration=float(i + 1), transcription_time=1.0)
+        
+        entry = load_transcription_stats()["small"]
+        
+        # Samples 6..25 are retained
+        assert entry["sum_audio"] == pytest.approx(sum(range(6, 26)))
+        assert entry["sum_transcription"] == pytest.approx(20.0)
+        assert entry["avg_ratio"] == pytest.approx(20.0 / sum(range(6, 26)))
+    
+    def test_record_transcription_time_upgrades_stats_without_sums(self, temp_settings_dir: Path):
+        """Test that stats saved without running sums are still averaged correctly."""
+        save_transcription_stats({
+            "base": {
+                "samples": [{"audio_duration": 10.0, "transcription_time": 2.0}],
+                "avg_ratio": 0.2
+            }
+        })
+        
+        record_transcription_time("base", audio_duration=10.0, transcription_time=8.0)
+        
+        assert load_transcription_stats()["base"]["avg_ratio"] == pytest.approx(0.5)
+
+
+class TestTranscriptionStatsLog:
+    """Tests for the append-only transcription sample log."""
+    
+    def test_record_appends_to_log_without_snapshot(self, temp_settings_dir: Path):
+        """Test that recording a sample appends one log line and leaves the snapshot alone."""
+        record_transcription_time("tiny", audio_duration=10.0, transcription_time=3.0)
+        record_transcription_time("tiny", audio_duration=10.0, transcription_time=3.0)
+        
+        lines = get_transcription_stats_log_path().read_bytes().splitlines()
+        
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == {"model": "tiny", "a": 10.0, "t": 3.0}
+        assert not get_transcription_stats_path().exists()
+    
+    def test_log_is_replayed_on_top_of_snapshot(self, temp_settings_dir: Path):
+        """Test that logged samples are applied on top of the saved snapshot."""
+        save_transcription_stats({
+            "base": {
+                "samples": [{"audio_duration": 10.0, "transcription_time": 2.0}],
+                "avg_ratio": 0.2
+            }
+        })
+        record_transcription_time("base", audio_duration=10.0, transcription_time=8.0)
+        
+        reset_cache()
+        stats = load_transcription_stats()
+        
+        assert len(stats["base"]["samples"]) == 2
+        assert stats["base"]["avg_ratio"] == pytest.approx(0.5)
+    
+    def test_external_append_with_same_mtime_is_read(self, temp_settings_dir: Path):
+        """Test that a log append within one mtime tick still invalidates the cache."""
+        record_transcription_time("tiny", audio_duration=10.0, transcription_time=3.0)
+        assert len(load_transcription_stats()["tiny"]["samples"]) == 1
+        
+        log_path = get_transcription_stats_log_path()
+        st = log_path.stat()
+        with open(log_path, 'ab') as f:
+            f.write(b'{"model": "tiny", "a": 10.0, "t": 3.0}\n')
+        os.utime(log_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert len(load_transcription_stats()["tiny"]["samples"]) == 2
+    
+    def test_truncated_log_line_is_skipped(self, temp_settings_dir: Path):
+        """Test that a partially written log line doesn't break loading."""
+        record_transcription_time("tiny", audio_duration=10.0, transcription_time=3.0)
+        with open(get_transcription_stats_log_path(), 'ab') as f:
+            f.write(b'{"model": "tiny", "a"')
+        
+        reset_cache()
+        stats = load_transcription_stats()
+        
+        assert len(stats["tiny"]["samples"]) == 1
+    
+    def test_log_is_compacted_into_snapshot(self, temp_settings_dir: Path, monkeypatch):
+        """Test that a long log is folded into the snapshot and removed."""
+        monkeypatch.setattr("local_whisper.settings.STATS_LOG_COMPACT_LINES", 3)
+        
+        for i in range(4):
+            record_transcription_time("small", audio_duration=10.0, transcription_time=5.0)
+        
+        # Wait for the background compaction to finish
+        for thread in threading.enumerate():
+            if thread.name == "transcription-stats-compaction":
+                thread.join(timeout=5)
+        
+        assert not get_transcription_stats_log_path().exists()
+        with open(get_transcription_stats_path(), 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        assert len(snapshot["small"]["samples"]) == 4
+        assert load_transcription_stats() == snapshot
+    
+    def test_only_one_compaction_runs_at_a_time(self, temp_settings_dir: Path, monkeypatch):
+        """Test that records past the threshold don't start a second compaction."""
+        monkeypatch.setattr("local_whisper.settings.STATS_LOG_COMPACT_LINES", 3)
+        
+        # Holding the cache lock keeps the first compaction from finishing
+        with settings_module._cache_lock:
+            for i in range(6):
+                record_transcription_time("small", audio_duration=10.0, transcription_time=5.0)
+            
+            compactions = [t for t in threading.enumerate() if t.name == "transcription-stats-compaction"]
+            assert len(compactions) == 1
+        
+        compactions[0].join(timeout=5)
+        assert len(load_transcription_stats()["small"]["samples"]) == 6
 
 
 class TestGetEstimatedTranscriptionTime:
     """Tests for transcription time estimation."""
     
+    def test_uses_history_for_non_interned_model_name(self, temp_settings_dir: Path):
+        """Test that model names built at runtime still match logged samples."""
+        record_transcription_time("large-v3", audio_duration=10.0, transcription_time=2.0)
+        
+        model_name = "-".join(["large", "v3"])
+        result = get_estimated_transcription_time(model_name, audio_duration=10.0)
+        
+        assert result == pytest.approx(2.0)
+    
     def test_uses_historical_data_when_available(self, temp_settings_dir: Path):
         """Test that estimation uses historical data when available."""
         # Record some history
@@ -224,6 +530,36 @@ class TestGetEstimatedTranscriptionTime:
         # With ratio 0.5, estimate should be 10.0
         assert result == pytest.approx(10.0)
     
+    def test_historical_ratio_matches_loaded_stats(self, temp_settings_dir: Path):
+        """Test that the estimate uses the same sample window as the loaded stats."""
+        save_transcription_stats({
+            "base": {
+                "samples": [{"audio_duration": 10.0, "transcription_time": 1.0}] * 15,
+                "avg_ratio": 0.1,
+            }
+        })
+        for i in range(10):
+            record_transcription_time("base", audio_duration=10.0, transcription_time=float(i))
+        record_transcription_time("tiny", audio_duration=10.0, transcription_time=50.0)
+        
+        expected = load_transcription_stats()["base"]["avg_ratio"]
+        result = get_estimated_transcription_time("base", audio_duration=10.0)
+        
+        assert result == pytest.approx(10.0 * expected)
+    
+    def test_uses_snapshot_avg_ratio_without_logged_samples(self, temp_settings_dir: Path):
+        """Test that the stored average ratio is used when nothing has been logged since."""
+        save_transcription_stats({
+            "small": {
+                "samples": [{"audio_duration": 10.0, "transcription_time": 8.0}],
+                "avg_ratio": 0.8,
+            }
+        })
+        
+        result = get_estimated_transcription_time("small", audio_duration=10.0)
+        
+        assert result == pytest.approx(8.0)
+    
     def test_uses_default_ratio_for_tiny(self, temp_settings_dir: Path):
         """Test default ratio for tiny model."""
         result = get_estimated_transcription_time("tiny", audio_duration=10.0)
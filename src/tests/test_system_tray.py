@@ -1,14 +1,60 @@
 """Tests for the system_tray UI module."""
 
+import hashlib
+
 import pytest
 from unittest.mock import MagicMock, patch
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication, QMenu
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QImage, QPainter, QColor, QBrush
+import numpy as np
 
 from local_whisper.ui.system_tray import SystemTray, create_tray_icon
 
 
+def _icon_fingerprint(icon: QIcon) -> bytes:
+    """Hash an icon's 64x64 pixel buffer in one pass over the raw bytes."""
+    image = icon.pixmap(64, 64).toImage()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return hashlib.blake2b(bits, digest_size=8).digest()
+
+
+def _icon_pixels(image: QImage) -> np.ndarray:
+    """Copy a 64x64 image's premultiplied ARGB32 pixels into an int array."""
+    image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    rows = np.frombuffer(bits, dtype=np.uint8).reshape(64, image.bytesPerLine())
+    return rows[:, :64 * 4].astype(np.int16)
+
+
+def _painted_reference_icon(recording: bool) -> QImage:
+    """Paint the tray icon with QPainter, the way it was drawn before the coverage masks."""
+    size = 64
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    color = QColor("#ff4757" if recording else "#00d4aa")
+    painter.setBrush(QBrush(color))
+    painter.setPen(color)
+    painter.drawEllipse(8, 8, size - 16, size - 16)
+    
+    mic_color = QColor("#1a1a2e")
+    painter.setBrush(QBrush(mic_color))
+    painter.setPen(mic_color)
+    mic_y = size // 2 - 12 - 4
+    painter.drawRoundedRect((size - 16) // 2, mic_y, 16, 24, 8, 8)
+    painter.drawRect((size - 4) // 2, mic_y + 24, 4, 8)
+    painter.drawRect((size - 20) // 2, mic_y + 32, 20, 4)
+    
+    painter.end()
+    return image
+
+
 class TestCreateTrayIcon:
     """Tests for create_tray_icon function."""
     
@@ -45,6 +91,38 @@ class TestCreateTrayIcon:
         
         # They should be different (different colors)
         assert idle_image != recording_image
+    
+    def test_icons_are_cached_per_state(self, qtbot):
+        """Test that repeated calls reuse the rendered icon for each state."""
+        assert create_tray_icon(recording=True).cacheKey() == create_tray_icon(True).cacheKey()
+        assert create_tray_icon().cacheKey() == create_tray_icon(recording=False).cacheKey()
+    
+    def test_icon_fingerprints_differ_per_state(self, qtbot):
+        """Test that idle and recording icons have different pixel fingerprints."""
+        idle_fingerprint = _icon_fingerprint(create_tray_icon(recording=False))
+        recording_fingerprint = _icon_fingerprint(create_tray_icon(recording=True))
+        
+        assert idle_fingerprint != recording_fingerprint
+    
+    @pytest.mark.parametrize("recording", [False, True])
+    def test_icon_matches_painted_reference(self, qtbot, recording):
+        """Test that the rendered icon stays close to the QPainter drawing."""
+        rendered = _icon_pixels(create_tray_icon(recording).pixmap(64, 64).toImage())
+        reference = _icon_pixels(_painted_reference_icon(recording))
+        
+        diff = np.abs(rendered - reference)
+        # Edges differ by at most about a quarter of a pixel's coverage
+        assert diff.max() <= 64
+        assert diff.mean() < 2
+    
+    def test_set_recording_same_state_keeps_icon(self, qtbot):
+        """Test that re-applying the current state leaves the icon untouched."""
+        tray = SystemTray()
+        before = _icon_fingerprint(tray.icon())
+        
+        tray.set_recording(False)
+        
+        assert _icon_fingerprint(tray.icon()) == before
 
 
 class TestSystemTrayInit:
@@ -107,6 +185,15 @@ class TestSystemTrayMenu:
         
         has_separator = any(a.isSeparator() for a in actions)
         assert has_separator
+    
+    def test_action_properties_are_menu_actions(self, system_tray):
+        """Test that the action properties refer to the context menu's actions."""
+        actions = system_tray.contextMenu().actions()
+        
+        assert system_tray.show_action in actions
+        assert system_tray.exit_action in actions
+        assert system_tray.show_action.text() == "Show Window"
+        assert system_tray.exit_action.text() == "Exit"
 
 
 class TestSystemTraySignals:
@@ -128,31 +215,13 @@ class TestSystemTraySignals:
     
     def test_show_action_emits_signal(self, system_tray, qtbot):
         """Test that Show Window action emits signal."""
-        menu = system_tray.contextMenu()
-        show_action = None
-        for action in menu.actions():
-            if "Show" in action.text():
-                show_action = action
-                break
-        
-        assert show_action is not None
-        
         with qtbot.waitSignal(system_tray.show_window_requested, timeout=1000):
-            show_action.trigger()
+            system_tray.show_action.trigger()
     
     def test_exit_action_emits_signal(self, system_tray, qtbot):
         """Test that Exit action emits signal."""
-        menu = system_tray.contextMenu()
-        exit_action = None
-        for action in menu.actions():
-            if "Exit" in action.text():
-                exit_action = action
-                break
-        
-        assert exit_action is not None
-        
         with qtbot.waitSignal(system_tray.exit_requested, timeout=1000):
-            exit_action.trigger()
+            system_tray.exit_action.trigger()
 
 
 class TestSystemTrayRecordingState:
@@ -176,12 +245,13 @@ class TestSystemTrayRecordingState:
         new_pixmap = new_icon.pixmap(64, 64).toImage()
         assert initial_pixmap != new_pixmap
     
-    def test_set_recording_false_changes_icon(self, system_tray):
+    def test_set_recording_false_changes_icon(self, system_tray, qtbot):
         """Test that set_recording(False) changes the icon back."""
         system_tray.set_recording(True)
         recording_icon = system_tray.icon()
         
         system_tray.set_recording(False)
+        qtbot.waitUntil(lambda: not system_tray._recording_debounce.isActive())
         
         idle_icon = system_tray.icon()
         # Icons should be different
@@ -189,18 +259,46 @@ class TestSystemTrayRecordingState:
         idle_pixmap = idle_icon.pixmap(64, 64).toImage()
         assert recording_pixmap != idle_pixmap
     
-    def test_set_recording_updates_tooltip(self, system_tray):
+    def test_set_recording_updates_tooltip(self, system_tray, qtbot):
         """Test that set_recording updates tooltip."""
         system_tray.set_recording(True)
         recording_tooltip = system_tray.toolTip()
         
         system_tray.set_recording(False)
+        qtbot.waitUntil(lambda: not system_tray._recording_debounce.isActive())
         idle_tooltip = system_tray.toolTip()
         
         # Tooltips should be different
         assert recording_tooltip != idle_tooltip
         assert "Recording" in recording_tooltip or "stop" in recording_tooltip.lower()
         assert "record" in idle_tooltip.lower()
+    
+    def test_rapid_set_recording_is_coalesced(self, system_tray, qtbot, monkeypatch):
+        """Test that a burst of state changes applies the first and the last state only."""
+        icons = []
+        original_set_icon = system_tray.setIcon
+        
+        def tracking_set_icon(icon):
+            icons.append(icon.cacheKey())
+            original_set_icon(icon)
+        
+        monkeypatch.setattr(system_tray, "setIcon", tracking_set_icon)
+        
+        for recording in (True, False, True, False, True):
+            system_tray.set_recording(recording)
+        qtbot.waitUntil(lambda: not system_tray._recording_debounce.isActive())
+        
+        # Leading update to True; the trailing state is also True, so no more
+        assert len(icons) == 1
+        assert "Recording" in system_tray.toolTip()
+        
+        system_tray.set_recording(False)
+        system_tray.set_recording(True)
+        system_tray.set_recording(False)
+        qtbot.waitUntil(lambda: not system_tray._recording_debounce.isActive())
+        
+        assert len(icons) == 2
+        assert "Recording" not in system_tray.toolTip()
 
 
 class TestSystemTrayShowMessage:
@@ -22,14 +22,15 @@ class TestTextOutputInit:
         
         assert output.typing_interval == 0.05
     
-    def test_init_disables_failsafe(self, monkeypatch):
-        """Test that FAILSAFE is disabled on init."""
+    def test_typing_disables_failsafe(self, mock_pyautogui, monkeypatch):
+        """Test that FAILSAFE is disabled once pyautogui is used."""
         import pyautogui
         
         # Set FAILSAFE to True initially
         monkeypatch.setattr(pyautogui, "FAILSAFE", True)
         
         output = TextOutput()
+        output.type_text("Test", delay_before=0)
         
         assert pyautogui.FAILSAFE is False
 
@@ -113,72 +114,138 @@ class TestTypeText:
         output.type_text("Test", delay_before=0.5)
         
         assert 0.5 in sleep_calls
+    
+    def test_type_text_back_to_back_skips_delay(self, mock_pyautogui, monkeypatch):
+        """Test that a call within the delay window of the previous one doesn't sleep."""
+        output = TextOutput()
+        
+        sleep_calls = []
+        monkeypatch.setattr(time, "sleep", sleep_calls.append)
+        
+        output.type_text("First")
+        output.type_text("Second")
+        
+        assert sleep_calls == [0.1]
+        assert mock_pyautogui.typed_texts == ["First", "Second"]
+    
+    def test_type_text_delay_after_idle(self, mock_pyautogui, monkeypatch):
+        """Test that the delay applies again once the delay window has passed."""
+        output = TextOutput()
+        
+        sleep_calls = []
+        monkeypatch.setattr(time, "sleep", sleep_calls.append)
+        
+        output.type_text("First")
+        output._last_type_end -= 1.0
+        output.type_text("Second")
+        
+        assert sleep_calls == [0.1, 0.1]
+    
+    def test_type_text_zero_delay_does_not_sleep(self, mock_pyautogui, monkeypatch):
+        """Test that a zero delay skips the sleep call entirely."""
+        output = TextOutput()
+        
+        sleep_calls = []
+        monkeypatch.setattr(time, "sleep", sleep_calls.append)
+        
+        output.type_text("Test", delay_before=0)
+        
+        assert sleep_calls == []
+        assert mock_pyautogui.typed_texts == ["Test"]
 
 
 class TestTypeTextFast:
     """Tests for type_text_fast method."""
     
-    def test_type_text_fast_calls_write(self, mock_pyautogui):
-        """Test that type_text_fast calls pyautogui.write."""
+    def test_type_text_fast_calls_keyboard_write(self, mock_pyautogui, mock_keyboard):
+        """Test that type_text_fast types through keyboard.write in one call."""
         output = TextOutput()
         
         output.type_text_fast("Fast typing")
         
-        mock_pyautogui.write.assert_called_once()
+        mock_keyboard.write.assert_called_once_with("Fast typing", delay=0)
+        mock_pyautogui.write.assert_not_called()
     
-    def test_type_text_fast_uses_low_interval(self, mock_pyautogui):
-        """Test that type_text_fast uses very low interval."""
+    def test_type_text_fast_empty_string(self, mock_pyautogui, mock_keyboard):
+        """Test that type_text_fast handles empty string."""
         output = TextOutput()
         
-        output.type_text_fast("Fast")
+        output.type_text_fast("")
         
-        call_kwargs = mock_pyautogui.write.call_args[1]
-        assert call_kwargs['interval'] == 0.001
+        mock_keyboard.write.assert_not_called()
+        mock_pyautogui.write.assert_not_called()
     
-    def test_type_text_fast_empty_string(self, mock_pyautogui):
-        """Test that type_text_fast handles empty string."""
-        output = TextOutput()
+    def test_type_text_with_fast_interval_uses_keyboard(self, mock_pyautogui, mock_keyboard):
+        """Test that type_text skips pyautogui when the interval is negligible."""
+        output = TextOutput(typing_interval=0)
         
-        output.type_text_fast("")
+        output.type_text("Hëllo")
         
+        mock_keyboard.write.assert_called_once_with("Hëllo", delay=0)
         mock_pyautogui.write.assert_not_called()
 
 
 class TestPressKey:
     """Tests for press_key static method."""
     
-    def test_press_key_calls_press(self, mock_pyautogui):
-        """Test that press_key calls pyautogui.press."""
+    def test_press_key_sends_scan_code(self, mock_pyautogui, mock_keyboard):
+        """Test that press_key sends the key's scan code through keyboard."""
         TextOutput.press_key("enter")
         
-        mock_pyautogui.press.assert_called_once_with("enter")
+        mock_keyboard.send.assert_called_once_with(28)
+        mock_pyautogui.press.assert_not_called()
     
-    def test_press_key_various_keys(self, mock_pyautogui):
+    def test_press_key_various_keys(self, mock_pyautogui, mock_keyboard):
         """Test pressing various keys."""
         keys = ["enter", "tab", "backspace", "escape", "space"]
         
         for key in keys:
-            mock_pyautogui.press.reset_mock()
+            mock_keyboard.send.reset_mock()
             TextOutput.press_key(key)
-            mock_pyautogui.press.assert_called_once_with(key)
+            mock_keyboard.send.assert_called_once_with(mock_keyboard.scan_codes[key])
+    
+    def test_press_key_caches_lookup(self, mock_pyautogui, mock_keyboard):
+        """Test that repeated presses resolve the key name once."""
+        TextOutput.press_key("tab")
+        TextOutput.press_key("tab")
+        
+        mock_keyboard.key_to_scan_codes.assert_called_once_with("tab")
+        assert mock_keyboard.send.call_count == 2
+    
+    def test_press_key_unknown_falls_back_to_pyautogui(self, mock_pyautogui, mock_keyboard):
+        """Test that keys keyboard can't map are pressed through pyautogui."""
+        TextOutput.press_key("volumemute")
+        
+        mock_pyautogui.press.assert_called_once_with("volumemute")
+        mock_keyboard.send.assert_not_called()
+    
+    @pytest.mark.parametrize("key", ["A", "!", "+"])
+    def test_press_key_needing_shift_uses_pyautogui(self, mock_pyautogui, mock_keyboard, key):
+        """Test that keys typed with a modifier are pressed through pyautogui."""
+        TextOutput.press_key(key)
+        
+        mock_pyautogui.press.assert_called_once_with(key)
+        mock_keyboard.send.assert_not_called()
+        mock_keyboard.key_to_scan_codes.assert_not_called()
 
 
 class TestHotkey:
     """Tests for hotkey static method."""
     
-    def test_hotkey_calls_hotkey(self, mock_pyautogui):
-        """Test that hotkey calls pyautogui.hotkey."""
+    def test_hotkey_sends_scan_codes(self, mock_pyautogui, mock_keyboard):
+        """Test that hotkey sends all scan codes in one keyboard call."""
         TextOutput.hotkey("ctrl", "v")
         
-        mock_pyautogui.hotkey.assert_called_once()
+        mock_keyboard.send.assert_called_once_with((29, 47))
+        mock_pyautogui.hotkey.assert_not_called()
     
-    def test_hotkey_passes_all_keys(self, mock_pyautogui):
+    def test_hotkey_passes_all_keys(self, mock_pyautogui, mock_keyboard):
         """Test that hotkey passes all keys."""
         TextOutput.hotkey("ctrl", "shift", "a")
         
-        mock_pyautogui.hotkey.assert_called_once_with("ctrl", "shift", "a")
+        mock_keyboard.send.assert_called_once_with((29, 42, 30))
     
-    def test_hotkey_common_combinations(self, mock_pyautogui):
+    def test_hotkey_common_combinations(self, mock_pyautogui, mock_keyboard):
         """Test common hotkey combinations."""
         combinations = [
             ("ctrl", "c"),
@@ -189,7 +256,21 @@ class TestHotkey:
         ]
         
         for combo in combinations:
-            mock_pyautogui.hotkey.reset_mock()
+            mock_keyboard.send.reset_mock()
             TextOutput.hotkey(*combo)
-            mock_pyautogui.hotkey.assert_called_once_with(*combo)
-
+            expected = tuple(mock_keyboard.scan_codes[key] for key in combo)
+            mock_keyboard.send.assert_called_once_with(expected)
+    
+    def test_hotkey_unknown_key_falls_back_to_pyautogui(self, mock_pyautogui, mock_keyboard):
+        """Test that combinations with unmapped keys go through pyautogui."""
+        TextOutput.hotkey("ctrl", "volumemute")
+        
+        mock_pyautogui.hotkey.assert_called_once_with("ctrl", "volumemute")
+        mock_keyboard.send.assert_not_called()
+    
+    def test_hotkey_with_shifted_key_uses_pyautogui(self, mock_pyautogui, mock_keyboard):
+        """Test that combinations with a key needing Shift go through pyautogui."""
+        TextOutput.hotkey("ctrl", "+")
+        
+        mock_pyautogui.hotkey.assert_called_once_with("ctrl", "+")
+        mock_keyboard.send.assert_not_called()
@@ -1,8 +1,10 @@
 """Tests for the transcriber module."""
 
+import shutil
+
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import numpy as np
 
 from local_whisper.transcriber import (
@@ -16,35 +18,63 @@ from local_whisper.transcriber import (
 )
 
 
+# Zero-length audio input, shared by tests that only read it
+_EMPTY_AUDIO = np.empty(0, dtype=np.float32)
+
+
+class _FailingHfApi:
+    """HfApi stand-in whose repo lookup fails like a network error."""
+    
+    def repo_info(self, *args, **kwargs):
+        raise Exception("Network error")
+
+
+class _ProgressRecorder:
+    """Progress callback that keeps only a call count and the first/last values."""
+    
+    def __init__(self):
+        self.count = 0
+        self.first = None
+        self.last = None
+        self.saw_error = False
+    
+    def __call__(self, progress, _detail):
+        if self.count == 0:
+            self.first = progress
+        self.count += 1
+        self.last = progress
+        if progress == -1:
+            self.saw_error = True
+
+
 class TestFormatBytes:
     """Tests for the _format_bytes utility function."""
     
-    def test_format_bytes_bytes(self):
-        """Test formatting bytes (< 1KB)."""
-        assert _format_bytes(0) == "0 B"
-        assert _format_bytes(1) == "1 B"
-        assert _format_bytes(512) == "512 B"
-        assert _format_bytes(1023) == "1023 B"
-    
-    def test_format_bytes_kilobytes(self):
-        """Test formatting kilobytes (1KB - 1MB)."""
-        assert _format_bytes(1024) == "1.0 KB"
-        assert _format_bytes(1536) == "1.5 KB"
-        assert _format_bytes(10240) == "10.0 KB"
-        assert _format_bytes(1024 * 1024 - 1) == "1024.0 KB"
-    
-    def test_format_bytes_megabytes(self):
-        """Test formatting megabytes (1MB - 1GB)."""
-        assert _format_bytes(1024 * 1024) == "1.0 MB"
-        assert _format_bytes(1024 * 1024 * 1.5) == "1.5 MB"
-        assert _format_bytes(1024 * 1024 * 100) == "100.0 MB"
-        assert _format_bytes(1024 * 1024 * 1024 - 1) == "1024.0 MB"
-    
-    def test_format_bytes_gigabytes(self):
-        """Test formatting gigabytes (>= 1GB)."""
-        assert _format_bytes(1024 * 1024 * 1024) == "1.00 GB"
-        assert _format_bytes(int(1024 * 1024 * 1024 * 1.5)) == "1.50 GB"
-        assert _format_bytes(1024 * 1024 * 1024 * 3) == "3.00 GB"
+    @pytest.mark.parametrize("bytes_val,expected", [
+        # Bytes (< 1KB)
+        (0, "0 B"),
+        (1, "1 B"),
+        (512, "512 B"),
+        (1023, "1023 B"),
+        # Kilobytes (1KB - 1MB)
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (10240, "10.0 KB"),
+        (1024 * 1024 - 1, "1024.0 KB"),
+        # Megabytes (1MB - 1GB)
+        (1024 * 1024, "1.0 MB"),
+        (1024 * 1024 * 1.5, "1.5 MB"),
+        (1024 * 1024 * 100, "100.0 MB"),
+        (1024 * 1024 * 1024 - 1, "1024.0 MB"),
+        # Gigabytes (>= 1GB), including sizes beyond 1TB
+        (1024 * 1024 * 1024, "1.00 GB"),
+        (int(1024 * 1024 * 1024 * 1.5), "1.50 GB"),
+        (1024 * 1024 * 1024 * 3, "3.00 GB"),
+        (1024 ** 4, "1024.00 GB"),
+    ])
+    def test_format_bytes(self, bytes_val, expected):
+        """Test formatting byte counts in each unit."""
+        assert _format_bytes(bytes_val) == expected
 
 
 class TestModelDirectory:
@@ -52,9 +82,12 @@ class TestModelDirectory:
     
     def test_get_model_directory_creates_dir(self, temp_model_dir: Path, monkeypatch):
         """Test that get_model_directory creates the directory."""
-        import shutil
         if temp_model_dir.exists():
-            shutil.rmtree(temp_model_dir)
+            try:
+                # Fresh fixture directory is empty, so one rmdir is enough
+                temp_model_dir.rmdir()
+            except OSError:
+                shutil.rmtree(temp_model_dir)
         
         result = get_model_directory()
         
@@ -62,25 +95,30 @@ class TestModelDirectory:
         assert result.is_dir()
         assert result.name == "models"
     
-    def test_get_model_path_uses_repo_map(self, temp_model_dir: Path):
+    def test_get_model_path_uses_repo_map(self, shared_model_dir: Path):
         """Test that get_model_path uses the MODEL_REPO_MAP."""
         result = get_model_path("tiny")
         
         expected_cache_name = "models--Systran--faster-whisper-tiny"
         assert result.name == expected_cache_name
     
-    def test_get_model_path_handles_unknown_model(self, temp_model_dir: Path):
+    def test_get_model_path_handles_unknown_model(self, shared_model_dir: Path):
         """Test get_model_path with unknown model name."""
         result = get_model_path("custom/model-name")
         
         expected_cache_name = "models--custom--model-name"
         assert result.name == expected_cache_name
+    
+    def test_get_model_path_is_cached(self, shared_model_dir: Path):
+        """Test that repeated lookups return the same cached Path."""
+        assert get_model_path("base") is get_model_path("base")
+        assert get_model_path("base").parent == shared_model_dir
 
 
 class TestIsModelDownloaded:
     """Tests for checking if model is downloaded."""
     
-    def test_returns_false_when_path_not_exists(self, temp_model_dir: Path):
+    def test_returns_false_when_path_not_exists(self, shared_model_dir: Path):
         """Test returns False when model path doesn't exist."""
         result = is_model_downloaded("nonexistent-model")
         
@@ -112,32 +150,40 @@ class TestIsModelDownloaded:
         assert result is True
 
 
-class TestModelRepoMap:
-    """Tests for MODEL_REPO_MAP constant."""
+class TestModelCatalog:
+    """Tests for the MODEL_REPO_MAP and AVAILABLE_MODELS constants."""
     
-    def test_contains_all_standard_models(self):
-        """Test that MODEL_REPO_MAP contains all standard models."""
-        expected_models = ["tiny", "base", "small", "medium", "large-v3"]
+    def test_model_catalog_invariants(self):
+        """Test that the repo map and available models list agree on the standard models."""
+        expected = ("tiny", "base", "small", "medium", "large-v3")
         
-        for model in expected_models:
-            assert model in MODEL_REPO_MAP
-    
-    def test_repo_names_are_systran(self):
-        """Test that all repos are from Systran."""
-        for model, repo in MODEL_REPO_MAP.items():
-            assert repo.startswith("Systran/faster-whisper-")
+        assert frozenset(MODEL_REPO_MAP) >= frozenset(expected)
+        assert all(repo.startswith("Systran/faster-whisper-") for repo in MODEL_REPO_MAP.values())
+        
+        models = Transcriber.get_available_models()
+        assert tuple(m["name"] for m in models) == expected
+        
+        required = {"name", "display_name", "size", "description"}
+        assert all(required <= m.keys() for m in models)
+        assert all("OpenAI Whisper" in m["display_name"] for m in models)
+        assert all("~" in m["size"] for m in models)  # e.g., "~150 MB"
+
 
+@pytest.fixture(scope="class")
+def pristine_transcriber() -> Transcriber:
+    """Default Transcriber shared by tests that only read its state."""
+    return Transcriber()
 
+
+@pytest.mark.numpy
 class TestTranscriberClass:
     """Tests for the Transcriber class."""
     
-    def test_init_default_values(self):
+    def test_init_default_values(self, pristine_transcriber):
         """Test Transcriber initialization with defaults."""
-        transcriber = Transcriber()
-        
-        assert transcriber.model_size == "base"
-        assert transcriber.device == "auto"
-        assert transcriber.model is None
+        assert pristine_transcriber.model_size == "base"
+        assert pristine_transcriber.device == "auto"
+        assert pristine_transcriber.model is None
     
     def test_init_custom_values(self):
         """Test Transcriber initialization with custom values."""
@@ -146,11 +192,9 @@ class TestTranscriberClass:
         assert transcriber.model_size == "small"
         assert transcriber.device == "cpu"
     
-    def test_is_loaded_returns_false_initially(self):
+    def test_is_loaded_returns_false_initially(self, pristine_transcriber):
         """Test that is_loaded returns False before loading."""
-        transcriber = Transcriber()
-        
-        assert transcriber.is_loaded() is False
+        assert pristine_transcriber.is_loaded() is False
     
     def test_set_model_size_changes_size(self):
         """Test that set_model_size changes the model size."""
@@ -185,15 +229,6 @@ class TestTranscriberClass:
         assert len(result) > 0
         assert all(isinstance(m, dict) for m in result)
     
-    def test_get_available_models_has_required_keys(self):
-        """Test that each model has required keys."""
-        result = Transcriber.get_available_models()
-        
-        required_keys = ["name", "display_name", "size", "description"]
-        for model in result:
-            for key in required_keys:
-                assert key in model
-    
     def test_get_available_models_returns_copy(self):
         """Test that get_available_models returns a copy."""
         result1 = Transcriber.get_available_models()
@@ -203,119 +238,83 @@ class TestTranscriberClass:
         
         assert len(result1) != len(result2)
     
+    def test_get_available_models_entries_are_copies(self):
+        """Test that modifying a returned model dict doesn't affect later calls."""
+        result = Transcriber.get_available_models()
+        result[0]["name"] = "modified"
+        
+        assert Transcriber.get_available_models()[0]["name"] == "tiny"
+    
     def test_is_model_downloaded_static_method(self, fake_downloaded_model: str):
         """Test the static is_model_downloaded method."""
         assert Transcriber.is_model_downloaded(fake_downloaded_model) is True
         assert Transcriber.is_model_downloaded("nonexistent") is False
     
-    def test_transcribe_raises_when_model_not_loaded(self):
+    def test_transcribe_raises_when_model_not_loaded(self, pristine_transcriber, silence_1s):
         """Test that transcribe raises error when model not loaded."""
-        transcriber = Transcriber()
-        audio = np.zeros(16000, dtype=np.float32)
+        with pytest.raises(RuntimeError) as excinfo:
+            pristine_transcriber.transcribe(silence_1s)
         
-        with pytest.raises(RuntimeError, match="Model not loaded"):
-            transcriber.transcribe(audio)
+        assert "Model not loaded" in str(excinfo.value)
     
     def test_transcribe_returns_empty_for_empty_audio(self, mock_whisper_model):
         """Test that transcribe returns empty string for empty audio."""
         transcriber = Transcriber()
         transcriber.model = mock_whisper_model
         
-        result = transcriber.transcribe(np.array([], dtype=np.float32))
+        result = transcriber.transcribe(_EMPTY_AUDIO)
         
         assert result == ""
     
-    def test_transcribe_returns_text(self, mock_whisper_model):
+    def test_transcribe_returns_text(self, mock_whisper_model, silence_1s):
         """Test that transcribe returns transcribed text."""
         transcriber = Transcriber()
         transcriber.model = mock_whisper_model
-        audio = np.zeros(16000, dtype=np.float32)  # 1 second of silence
         
-        result = transcriber.transcribe(audio)
+        result = transcriber.transcribe(silence_1s)
         
         assert isinstance(result, str)
         assert len(result) > 0
     
-    def test_transcribe_calls_progress_callback(self, mock_whisper_model):
+    def test_transcribe_calls_progress_callback(self, mock_whisper_model, silence_1s):
         """Test that transcribe calls progress callback."""
         transcriber = Transcriber()
         transcriber.model = mock_whisper_model
-        audio = np.zeros(16000, dtype=np.float32)
         
-        progress_calls = []
-        def on_progress(progress, duration):
-            progress_calls.append((progress, duration))
+        on_progress = _ProgressRecorder()
         
-        transcriber.transcribe(audio, on_progress=on_progress)
+        transcriber.transcribe(silence_1s, on_progress=on_progress)
         
-        assert len(progress_calls) > 0
+        assert on_progress.count > 0
         # Final progress should be 100
-        assert progress_calls[-1][0] == 100.0
+        assert on_progress.last == 100.0
 
 
 class TestDownloadModel:
     """Tests for the download_model function."""
     
+    @pytest.mark.slow
     def test_download_model_calls_progress(self, mock_hf_api, temp_model_dir: Path):
         """Test that download_model calls progress callback."""
-        progress_calls = []
-        
-        def on_progress(percent, message):
-            progress_calls.append((percent, message))
+        on_progress = _ProgressRecorder()
         
         download_model("tiny", on_progress=on_progress)
         
-        assert len(progress_calls) > 0
+        assert on_progress.count > 0
         # Should start with 0
-        assert progress_calls[0][0] == 0
+        assert on_progress.first == 0
         # Should end with 100
-        assert progress_calls[-1][0] == 100
+        assert on_progress.last == 100
     
-    def test_download_model_handles_error(self, monkeypatch, temp_model_dir: Path):
+    def test_download_model_handles_error(self, shared_model_dir: Path):
         """Test that download_model handles errors gracefully."""
-        # Mock HfApi to raise an error
-        def mock_repo_info(*args, **kwargs):
-            raise Exception("Network error")
+        on_progress = _ProgressRecorder()
         
-        mock_api = MagicMock()
-        mock_api.repo_info = mock_repo_info
-        monkeypatch.setattr("local_whisper.transcriber.HfApi", lambda: mock_api)
+        with patch("local_whisper.transcriber.HfApi", _FailingHfApi):
+            with pytest.raises(Exception) as excinfo:
+                download_model("tiny", on_progress=on_progress)
         
-        progress_calls = []
-        def on_progress(percent, message):
-            progress_calls.append((percent, message))
-        
-        with pytest.raises(Exception, match="Network error"):
-            download_model("tiny", on_progress=on_progress)
+        assert str(excinfo.value) == "Network error"
         
         # Should have reported error via progress
-        assert any(p[0] == -1 for p in progress_calls)
-
-
-class TestTranscriberAvailableModels:
-    """Tests for AVAILABLE_MODELS constant."""
-    
-    def test_available_models_contains_expected_models(self):
-        """Test that AVAILABLE_MODELS contains expected model names."""
-        models = Transcriber.get_available_models()
-        model_names = [m['name'] for m in models]
-        
-        expected = ["tiny", "base", "small", "medium", "large-v3"]
-        assert model_names == expected
-    
-    def test_available_models_have_display_names(self):
-        """Test that all models have display names."""
-        models = Transcriber.get_available_models()
-        
-        for model in models:
-            assert "display_name" in model
-            assert "OpenAI Whisper" in model["display_name"]
-    
-    def test_available_models_have_sizes(self):
-        """Test that all models have size information."""
-        models = Transcriber.get_available_models()
-        
-        for model in models:
-            assert "size" in model
-            assert "~" in model["size"]  # e.g., "~150 MB"
-
+        assert on_progress.saw_error